@@ -6,6 +6,7 @@ import pygame as pg
 
 import config as C
 from sprites import Asteroid, Ship, UFO
+from text_cache import render_text
 from utils import Vec, rand_edge_pos, rand_unit_vec
 
 
@@ -193,5 +194,5 @@ class World:
 
         pg.draw.line(surf, (60, 60, 60), (0, 50), (C.WIDTH, 50), width=1)
         txt = f"SCORE {self.score:06d}   LIVES {self.lives}   WAVE {self.wave}"
-        label = font.render(txt, True, C.WHITE)
+        label = render_text(font, txt, True, C.WHITE)
         surf.blit(label, (10, 10))
@@ -6,6 +6,7 @@ from typing import Iterable, Tuple
 import pygame as pg
 
 import config as C
+from text_cache import render_text
 
 Vec = pg.math.Vector2
 
@@ -43,6 +44,6 @@ def draw_circle(surface: pg.Surface, pos: Vec, r: int):
 
 
 def text(surface: pg.Surface, font: pg.font.Font, s: str, x: int, y: int):
-    surf = font.render(s, True, C.WHITE)
+    surf = render_text(font, s, True, C.WHITE)
     rect = surf.get_rect(topleft=(x, y))
     surface.blit(surf, rect)
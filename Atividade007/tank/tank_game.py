@@ -1,6 +1,7 @@
 import pygame
 from tank.tank_player import TankPlayer
 from core.bullet import Bullet
+from core.text_cache import render_text
 
 class TankGame:
     def __init__(self, screen, phase_manager):
@@ -106,6 +107,6 @@ class TankGame:
             player.draw(self.screen)
         for bullet in self.bullets:
             bullet.draw(self.screen)
-        score_text = self.font.render(
+        score_text = render_text(self.font, 
             f"P1: {self.score[0]}  P2: {self.score[1]}  Phase {self.phase} (TAB=Next)", True, (255,255,255))
         self.screen.blit(score_text, (20, 20))
@@ -7,6 +7,13 @@ class TankPlayer:
     SPRITE_COLS = 8
     PIXEL_SIZE = 6
 
+    # Directions the tank is drawn in: 8 uses the hand-drawn sprites as they are, finer steps
+    # (16, 32, ...) rotate the nearest hand-drawn sprite by the rest of the angle
+    ROTATION_STEPS = 8
+
+    # Sprites rasterized for every direction, per (color, rotation steps), shared by all tanks
+    sprite_atlas = {}
+
     # 8-directional tank sprites: UP, UP-RIGHT, RIGHT, DOWN-RIGHT, DOWN, DOWN-LEFT, LEFT, UP-LEFT
     TANK_SPRITES = [
         # UP
@@ -99,7 +106,7 @@ class TankPlayer:
         ],
     ]
 
-    def __init__(self, x, y, left, right, up, down, fire, color, angle = 0):
+    def __init__(self, x, y, left, right, up, down, fire, color, angle = 0, rotation_steps = ROTATION_STEPS):
         self.spawn_x = x
         self.spawn_y = y
         self.x = x
@@ -109,29 +116,55 @@ class TankPlayer:
         self.rect = pygame.Rect(x, y, self.SPRITE_COLS * self.PIXEL_SIZE, self.SPRITE_ROWS * self.PIXEL_SIZE)
         self.keys = dict(left=left, right=right, up=up, down=down, fire=fire)
         self.color = color
+        self.rotation_steps = rotation_steps
+        self.sprites = self.get_sprites(color, rotation_steps)
         self.last_fire = 0
         self.bullet = None
         self.owner = self
         self.speed = 0
 
+    # Draw one ASCII sprite into a surface, one rect per 'X'
+    @classmethod
+    def rasterize(cls, sprite, color):
+        surf = pygame.Surface((cls.SPRITE_COLS * cls.PIXEL_SIZE, cls.SPRITE_ROWS * cls.PIXEL_SIZE), pygame.SRCALPHA)
+        for row_idx, row in enumerate(sprite):
+            for col_idx, ch in enumerate(row):
+                if ch == 'X':
+                    pygame.draw.rect(
+                        surf,
+                        color,
+                        pygame.Rect(col_idx * cls.PIXEL_SIZE, row_idx * cls.PIXEL_SIZE, cls.PIXEL_SIZE, cls.PIXEL_SIZE)
+                    )
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        return surf
+
+    # Sprite and blit offset (so it stays centered on the tank) for every direction,
+    # built the first time a tank of this color is created
+    @classmethod
+    def get_sprites(cls, color, rotation_steps):
+        key = (tuple(color), rotation_steps)
+        if key not in cls.sprite_atlas:
+            hand_drawn = [cls.rasterize(sprite, color) for sprite in cls.TANK_SPRITES]
+            width = cls.SPRITE_COLS * cls.PIXEL_SIZE
+            height = cls.SPRITE_ROWS * cls.PIXEL_SIZE
+            step = 360 / len(cls.TANK_SPRITES)
+            sprites = []
+            for index in range(rotation_steps):
+                angle = index * 360 / rotation_steps
+                nearest = int(angle / step + 0.5) % len(cls.TANK_SPRITES)
+                rest = (angle - nearest * step + 180) % 360 - 180
+                surf = hand_drawn[nearest]
+                if rest:
+                    # pygame rotates counterclockwise, tank angles go clockwise
+                    surf = pygame.transform.rotate(surf, -rest)
+                sprites.append((surf, ((width - surf.get_width()) // 2, (height - surf.get_height()) // 2)))
+            cls.sprite_atlas[key] = sprites
+        return cls.sprite_atlas[key]
+
+    # Direction closest to the tank angle: 0 is up, then clockwise
     def get_sprite_index(self):
-        ang = (self.angle % 360)
-        if ang >= 337.5 or ang < 22.5:
-            return 0  # Up
-        elif 22.5 <= ang < 67.5:
-            return 1  # Up-Right
-        elif 67.5 <= ang < 112.5:
-            return 2  # Right
-        elif 112.5 <= ang < 157.5:
-            return 3  # Down-Right
-        elif 157.5 <= ang < 202.5:
-            return 4  # Down
-        elif 202.5 <= ang < 247.5:
-            return 5  # Down-Left
-        elif 247.5 <= ang < 292.5:
-            return 6  # Left
-        else:
-            return 7  # Up-Left
+        return int((self.angle % 360) * self.rotation_steps / 360 + 0.5) % self.rotation_steps
 
     def get_center_of_sprite(self):
         center_x = self.x + self.rect.width // 2
@@ -190,14 +223,5 @@ class TankPlayer:
         self.bullet = None
 
     def draw(self, screen):
-        sprite = self.TANK_SPRITES[self.get_sprite_index()]
-        surf = pygame.Surface((self.SPRITE_COLS * self.PIXEL_SIZE, self.SPRITE_ROWS * self.PIXEL_SIZE), pygame.SRCALPHA)
-        for row_idx, row in enumerate(sprite):
-            for col_idx, ch in enumerate(row):
-                if ch == 'X':
-                    pygame.draw.rect(
-                        surf,
-                        self.color,
-                        pygame.Rect(col_idx * self.PIXEL_SIZE, row_idx * self.PIXEL_SIZE, self.PIXEL_SIZE, self.PIXEL_SIZE)
-                    )
-        screen.blit(surf, (int(self.x), int(self.y)))
+        sprite, (offset_x, offset_y) = self.sprites[self.get_sprite_index()]
+        screen.blit(sprite, (int(self.x) + offset_x, int(self.y) + offset_y))
@@ -7,14 +7,15 @@
 #   5. If any of new characters sequence (phrases) has a perfect punctuation (28, all characters in correct sequence
 #     and position), stop. Otherwise, take the highest punctuation phrase and restart from step 2.
 #
+import argparse
+import contextlib
+import math
 import random
 import time
-import sys
 
-# Start timer
-start_time = time.perf_counter()
-MAXINT = sys.maxsize
-# 28 possible characters
+from weasel_trace import TraceWriter
+
+# 27 possible characters
 POSSIBLE_CHARACTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ "
 
 # Target phrase
@@ -26,109 +27,179 @@ QUANTITY_OF_COPIES = 100
 # Chance of mutation
 CHANCE_OF_MUTATION = 0.05
 
-# Generate a random number between 0 and length of POSSIBLE_CHARACTERS minus 1
-def generate_random_character():
-    # Define a real random seed to improve random number generator
-    random.seed(time.time_ns())
-
-    # Return a random letter from possible characters
-    return POSSIBLE_CHARACTERS[random.randint(0, len(POSSIBLE_CHARACTERS) - 1)]
-
-# Get a random number from 1 to 1.000.000 and verify if it is in a percentage chance
-def is_gonna_mutate():
-    # Define a real random seed to improve random number generator
-    random.seed(time.time_ns())
-
-    # Get a random int number from 1 to MAXINT
-    random_number = random.randint(1, MAXINT)
-
-    # Number threshold for mutation rate
-    number_threshold = CHANCE_OF_MUTATION * MAXINT
-
-    # If random_number is below or equal to number_threshold, then return true and mutate
-    if random_number <= number_threshold:
-        return True
-    else:
-        return False
+# Return a random letter from possible characters
+def generate_random_character(rng):
+    return rng.choice(POSSIBLE_CHARACTERS)
+
+# Return a list with quantity random letters from possible characters, drawn in bulk
+def generate_random_characters(rng, quantity):
+    return rng.choices(POSSIBLE_CHARACTERS, k=quantity)
+
+# Return the positions of a copy of length characters that mutate, each one with a chance of mutation. Instead of a
+# random number per character, the gap up to the next mutated position is drawn from its geometric distribution, so
+# long copies with a low chance of mutation only cost a random number per mutation
+def get_mutation_positions(rng, length, chance_of_mutation=CHANCE_OF_MUTATION):
+    if chance_of_mutation >= 1:
+        return list(range(length))
+    log_keep = math.log(1 - chance_of_mutation)
+    positions = []
+    position = int(math.log(1 - rng.random()) / log_keep)
+    while position < length:
+        positions.append(position)
+        position += 1 + int(math.log(1 - rng.random()) / log_keep)
+    return positions
 
 # Return an int number that is the punctuation of a sequence
-def calculate_points(string_list):
+def calculate_points(string_list, target_phrase=TARGET_PHRASE):
     # Variable to count letter in correct position
     points = 0
 
     # Count every time a letter is in the correct position
     for index, character in enumerate(string_list):
-        if character == TARGET_PHRASE[index]:
+        if character == target_phrase[index]:
             points += 1
 
     return points
 
-# Create a list with random uppercase characters
-def create_random_list():
-    random_sequence_list = []
-
-    for _ in range(0, len(TARGET_PHRASE)):
-        # Put the random generated character into string
-        random_sequence_list.append(generate_random_character())
-
-    return random_sequence_list
-
-#   1. Create a random sequence of characters (phrase)
-random_initial_sequence_list = create_random_list()
-
-# Create a copy of initial list to preserve it
-actual_sequence_list = random_initial_sequence_list.copy()
-
-# Calculate punctuation for the initial sequence
-max_points = calculate_points(actual_sequence_list)
-
-# Generation counter
-generation = 0
+# Raise ValueError if the target phrase has characters that are not possible characters (it could never be reached)
+def validate_target(target_phrase):
+    invalid_characters = sorted(set(target_phrase) - set(POSSIBLE_CHARACTERS))
+    if invalid_characters:
+        raise ValueError(f"target phrase can only have characters A-Z and space, got {''.join(invalid_characters)!r}")
+    return target_phrase
 
-# Repeat until a correct sequence is found (max_points == len(TARGET_PHRASE))
-while max_points < len(TARGET_PHRASE):
-    # Increase generation
-    generation += 1
+# Chance of mutation that changes about one character of every copy. The fixed CHANCE_OF_MUTATION changes 5% of
+# every copy, so with long targets (a 1000 characters target gets about 50 changes per copy) the mutations undo as
+# many matches as they make and the search levels off far from a full match
+def scaled_mutation_rate(length):
+    return 1 / max(length, 1)
 
-    #   2. Make copies of actual sequence (reproduction)
-    sequence_copies = []
-    for i in range(0, QUANTITY_OF_COPIES):
-        sequence_copies.append(actual_sequence_list.copy())
-
-    #   3. For each character, in every one of its copies, change it for a new random one  with a chance of mutation
-    for i, sequence in enumerate(sequence_copies):
-        for j, letter in enumerate(sequence):
-            if is_gonna_mutate():
-                sequence_copies[i][j] = generate_random_character()
-
-    #   4. Compare each new sequence with target phrase, and give to each generated copy a punctuation (quantity of
-    #   characters in correct sequence and position).
-
-    # Create a list to count points for each sequence
-    sequence_points_list = [0] * QUANTITY_OF_COPIES
-
-    # Calculate points for each sequence
-    for i, sequence in enumerate(sequence_copies):
-        sequence_points_list[i] = calculate_points(sequence)
-
-    # 5. If any of new characters sequence (phrases) has a perfect punctuation (28, all characters in correct sequence
-    #     and position), stop. Otherwise, take the highest punctuation phrase and restart from step 2.
-
-    # Find max point sequence and its index
-    max_points = max(sequence_points_list)
-    max_index = sequence_points_list.index(max_points)
-
-    # Copy the max point sequence to use it as the basis of next generation
-    actual_sequence_list = sequence_copies[max_index]
-
-    # Print generation, chosen sequence and its points
-    print(f"Generation: {generation} - {actual_sequence_list} - Points: {max_points}")
-
-# Stop timer
-stop_time = time.perf_counter()
-
-# Elapsed time
-elapsed_time = stop_time - start_time
-
-# Print elapsed time
-print(f"Target sequence acquired in {elapsed_time:.4f} seconds!!!")
+# Create a list with random uppercase characters
+def create_random_list(rng, length=len(TARGET_PHRASE)):
+    return generate_random_characters(rng, length)
+
+# Run the algorithm until the target phrase is found and return the quantity of generations
+#   verbose=False runs quietly, print_every prints only one generation out of N (and the last one) and
+#   trace receives a (generation, best score, best string) record for every generation
+#   chance_of_mutation=None uses scaled_mutation_rate of the target length
+def run_weasel(target_phrase=TARGET_PHRASE, quantity_of_copies=QUANTITY_OF_COPIES,
+               chance_of_mutation=CHANCE_OF_MUTATION, rng=None, verbose=True, print_every=1, trace=None):
+    validate_target(target_phrase)
+    if chance_of_mutation is None:
+        chance_of_mutation = scaled_mutation_rate(len(target_phrase))
+    if not 0 < chance_of_mutation <= 1:
+        raise ValueError(f"chance of mutation must be greater than 0 and up to 1, got {chance_of_mutation}")
+
+    # Random number generator seeded only once for the whole run (same seed, same run)
+    if rng is None:
+        rng = random.Random()
+
+    #   1. Create a random sequence of characters (phrase)
+    random_initial_sequence_list = create_random_list(rng, len(target_phrase))
+
+    # Create a copy of initial list to preserve it
+    actual_sequence_list = random_initial_sequence_list.copy()
+
+    # Calculate punctuation for the initial sequence
+    max_points = calculate_points(actual_sequence_list, target_phrase)
+
+    # Generation counter
+    generation = 0
+
+    # Repeat until a correct sequence is found (max_points == len(target_phrase))
+    while max_points < len(target_phrase):
+        # Increase generation
+        generation += 1
+
+        #   2. Make copies of actual sequence (reproduction)
+        sequence_copies = []
+        for i in range(0, quantity_of_copies):
+            sequence_copies.append(actual_sequence_list.copy())
+
+        #   4. Compare each new sequence with target phrase, and give to each generated copy a punctuation (quantity of
+        #   characters in correct sequence and position). Every copy starts with the points of its parent, and only the
+        #   mutated positions are compared again.
+
+        # Create a list to count points for each sequence
+        sequence_points_list = [max_points] * quantity_of_copies
+
+        #   3. For each character, in every one of its copies, change it for a new random one with a chance of mutation
+        for i, sequence in enumerate(sequence_copies):
+            # Positions that will mutate in this copy, and one new random character for each of them
+            mutation_positions = get_mutation_positions(rng, len(sequence), chance_of_mutation)
+            new_characters = generate_random_characters(rng, len(mutation_positions))
+            for j, character in zip(mutation_positions, new_characters):
+                sequence_points_list[i] += (character == target_phrase[j]) - (sequence[j] == target_phrase[j])
+                sequence_copies[i][j] = character
+
+        # 5. If any of new characters sequence (phrases) has a perfect punctuation (28, all characters in correct
+        #     sequence and position), stop. Otherwise, take the highest punctuation phrase and restart from step 2.
+
+        # Find max point sequence and its index
+        max_points = max(sequence_points_list)
+        max_index = sequence_points_list.index(max_points)
+
+        # Copy the max point sequence to use it as the basis of next generation
+        actual_sequence_list = sequence_copies[max_index]
+
+        # Print generation, chosen sequence and its points
+        if verbose and (generation % print_every == 0 or max_points == len(target_phrase)):
+            print(f"Generation: {generation} - {actual_sequence_list} - Points: {max_points}")
+
+        # Record generation, chosen sequence and its points
+        if trace is not None:
+            trace.write(generation, max_points, "".join(actual_sequence_list).encode("ascii"))
+
+    return generation
+
+# argparse type for --mutation: a chance of mutation, or "auto" (None) for scaled_mutation_rate of the target length
+def mutation_rate(text):
+    if text == "auto":
+        return None
+    value = float(text)
+    if not 0 < value <= 1:
+        raise argparse.ArgumentTypeError(f"must be a chance greater than 0 and up to 1, or 'auto', got {value}")
+    return value
+
+# argparse type for options that must be a positive integer
+def positive_int(text):
+    value = int(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return value
+
+
+if __name__ == "__main__":
+    # Command line options
+    parser = argparse.ArgumentParser(description="Dawkin's Weasel Algorithm")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the random number generator (reproducible runs)")
+    parser.add_argument("--target", default=TARGET_PHRASE, help="target phrase (characters A-Z and space)")
+    parser.add_argument("--copies", type=int, default=QUANTITY_OF_COPIES, help="quantity of copies per generation")
+    parser.add_argument("--mutation", type=mutation_rate, default=CHANCE_OF_MUTATION,
+                        help="chance of mutation per character, or 'auto' for 1/length of the target (the fixed "
+                             "default only converges for short targets, use auto for long ones)")
+    parser.add_argument("--quiet", action="store_true", help="don't print the generations")
+    parser.add_argument("--print-every", type=positive_int, default=1, help="print only one generation out of N")
+    parser.add_argument("--trace", default=None, help="write every generation to a binary trace file")
+    args = parser.parse_args()
+    try:
+        validate_target(args.target)
+    except ValueError as error:
+        parser.error(str(error))
+
+    # The trace is closed (and its buffered records written) even when the run is interrupted
+    with TraceWriter(args.trace, len(args.target)) if args.trace else contextlib.nullcontext() as trace:
+        # Start timer
+        start_time = time.perf_counter()
+
+        run_weasel(args.target, args.copies, args.mutation, random.Random(args.seed),
+                   not args.quiet, args.print_every, trace)
+
+        # Stop timer
+        stop_time = time.perf_counter()
+
+    # Elapsed time
+    elapsed_time = stop_time - start_time
+
+    # Print elapsed time
+    print(f"Target sequence acquired in {elapsed_time:.4f} seconds!!!")
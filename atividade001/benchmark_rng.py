@@ -0,0 +1,97 @@
+# Benchmark: generations per second of the Weasel algorithm, before and after seeding the RNG only once
+#
+#   before       -> random.seed(time.time_ns()) before every single draw (old atividade001.py)
+#   after        -> one random.Random seeded once, characters drawn in bulk (atividade001.py)
+#   numpy engine -> one numpy Generator seeded once, whole generation drawn in bulk (weasel_engine.py)
+#
+import argparse
+import random
+import sys
+import time
+
+import numpy as np
+
+import weasel_engine
+
+POSSIBLE_CHARACTERS = weasel_engine.POSSIBLE_CHARACTERS
+TARGET_PHRASE = weasel_engine.TARGET_PHRASE
+QUANTITY_OF_COPIES = weasel_engine.QUANTITY_OF_COPIES
+CHANCE_OF_MUTATION = weasel_engine.CHANCE_OF_MUTATION
+MAXINT = sys.maxsize
+
+
+# Old generate_random_character(): reseeds the generator before every draw
+def reseeding_random_character():
+    random.seed(time.time_ns())
+    return POSSIBLE_CHARACTERS[random.randint(0, len(POSSIBLE_CHARACTERS) - 1)]
+
+
+# Old is_gonna_mutate(): reseeds the generator before every draw
+def reseeding_is_gonna_mutate():
+    random.seed(time.time_ns())
+    return random.randint(1, MAXINT) <= CHANCE_OF_MUTATION * MAXINT
+
+
+# Score a list of characters against the target phrase
+def calculate_points(string_list):
+    return sum(1 for character, target in zip(string_list, TARGET_PHRASE) if character == target)
+
+
+# One generation with the old reseeding draws
+def reseeding_generation(actual_sequence_list):
+    sequence_copies = [actual_sequence_list.copy() for _ in range(QUANTITY_OF_COPIES)]
+    for sequence in sequence_copies:
+        for j in range(len(sequence)):
+            if reseeding_is_gonna_mutate():
+                sequence[j] = reseeding_random_character()
+    return max(sequence_copies, key=calculate_points)
+
+
+# One generation drawing from a generator seeded only once
+def seeded_generation(actual_sequence_list, rng):
+    sequence_copies = [actual_sequence_list.copy() for _ in range(QUANTITY_OF_COPIES)]
+    for sequence in sequence_copies:
+        mutation_positions = [j for j in range(len(sequence)) if rng.random() < CHANCE_OF_MUTATION]
+        for j, character in zip(mutation_positions, rng.choices(POSSIBLE_CHARACTERS, k=len(mutation_positions))):
+            sequence[j] = character
+    return max(sequence_copies, key=calculate_points)
+
+
+# One generation of the numpy engine
+def numpy_generation(actual_sequence, target, rng):
+    population = weasel_engine.create_population(actual_sequence, QUANTITY_OF_COPIES)
+    weasel_engine.mutate_population(population, CHANCE_OF_MUTATION, rng)
+    return population[np.argmax(weasel_engine.calculate_points(population, target))]
+
+
+# Run generation_function over and over for a given time and return generations per second
+def measure(generation_function, sequence, duration):
+    generations = 0
+    start_time = time.perf_counter()
+    elapsed_time = 0.0
+    while elapsed_time < duration:
+        sequence = generation_function(sequence)
+        generations += 1
+        elapsed_time = time.perf_counter() - start_time
+    return generations / elapsed_time
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Weasel algorithm RNG benchmark (generations per second)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the seeded generators")
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds spent measuring each variant")
+    args = parser.parse_args()
+
+    python_rng = random.Random(args.seed)
+    numpy_rng = np.random.default_rng(args.seed)
+    initial_sequence = python_rng.choices(POSSIBLE_CHARACTERS, k=len(TARGET_PHRASE))
+    target = weasel_engine.encode_phrase(TARGET_PHRASE)
+
+    before = measure(reseeding_generation, initial_sequence, args.duration)
+    after = measure(lambda sequence: seeded_generation(sequence, python_rng), initial_sequence, args.duration)
+    engine = measure(lambda sequence: numpy_generation(sequence, target, numpy_rng),
+                     weasel_engine.encode_phrase("".join(initial_sequence)), args.duration)
+
+    print(f"before (reseed every draw): {before:10.1f} generations/s")
+    print(f"after (seeded once):        {after:10.1f} generations/s  ({after / before:.1f}x)")
+    print(f"numpy engine (seeded once): {engine:10.1f} generations/s  ({engine / before:.1f}x)")
@@ -0,0 +1,104 @@
+# Benchmark: generations per second of the NumPy Weasel engine as the target phrase grows
+#
+#   full        -> every generation materializes all copies and scores every character again
+#   incremental -> only the mutated positions are drawn and scored, starting from the parent's points
+#
+#   Speed alone doesn't say if a long target is practical, so for targets up to --converge-length the generations
+#   needed for a full match are also measured, with the chosen chance of mutation and with 1/length. A search that
+#   doesn't converge within --max-generations is reported as ">N (best points)".
+#
+import argparse
+import time
+
+import numpy as np
+
+import weasel_engine
+
+TARGET_LENGTHS = [28, 1_000, 100_000]
+
+
+# One generation scoring every character of every copy
+def full_generation(state, target, quantity_of_copies, chance_of_mutation, rng):
+    actual_sequence, _, _ = state
+    population = weasel_engine.create_population(actual_sequence, quantity_of_copies)
+    weasel_engine.mutate_population(population, chance_of_mutation, rng)
+    sequence_points = weasel_engine.calculate_points(population, target)
+    max_index = int(np.argmax(sequence_points))
+    return population[max_index], None, int(sequence_points[max_index])
+
+
+# One generation scoring only the mutated positions
+def incremental_generation(state, target, quantity_of_copies, chance_of_mutation, rng):
+    actual_sequence, actual_matches, actual_points = state
+    actual_points = weasel_engine.evolve_incremental(actual_sequence, actual_matches, actual_points, target,
+                                                     quantity_of_copies, chance_of_mutation, rng)
+    return actual_sequence, actual_matches, actual_points
+
+
+# Run generation_function over and over for a given time (at least once) and return generations per second
+def measure(generation_function, target, quantity_of_copies, chance_of_mutation, seed, duration):
+    rng = np.random.default_rng(seed)
+    actual_sequence = weasel_engine.create_random_sequence(len(target), rng)
+    actual_matches = actual_sequence == target
+    state = (actual_sequence, actual_matches, int(np.count_nonzero(actual_matches)))
+
+    generations = 0
+    start_time = time.perf_counter()
+    elapsed_time = 0.0
+    while elapsed_time < duration or generations == 0:
+        state = generation_function(state, target, quantity_of_copies, chance_of_mutation, rng)
+        generations += 1
+        elapsed_time = time.perf_counter() - start_time
+    return generations / elapsed_time
+
+
+# Run the incremental engine until a full match (or max_generations) and describe the generations it took
+def converge(target, quantity_of_copies, chance_of_mutation, seed, max_generations):
+    rng = np.random.default_rng(seed)
+    actual_sequence = weasel_engine.create_random_sequence(len(target), rng)
+    actual_matches = actual_sequence == target
+    actual_points = int(np.count_nonzero(actual_matches))
+
+    generation = 0
+    while actual_points < len(target):
+        if generation == max_generations:
+            return f">{max_generations} ({actual_points})"
+        actual_points = weasel_engine.evolve_incremental(actual_sequence, actual_matches, actual_points, target,
+                                                         quantity_of_copies, chance_of_mutation, rng)
+        generation += 1
+    return str(generation)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Weasel scoring scaling benchmark (generations per second)")
+    parser.add_argument("--copies", type=int, default=weasel_engine.QUANTITY_OF_COPIES,
+                        help="quantity of copies per generation")
+    parser.add_argument("--mutation", type=float, default=weasel_engine.CHANCE_OF_MUTATION,
+                        help="chance of mutation per character")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the target phrases and the generators")
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds spent measuring each variant")
+    parser.add_argument("--converge-length", type=int, default=1_000,
+                        help="longest target whose generations to converge are measured")
+    parser.add_argument("--max-generations", type=int, default=20_000,
+                        help="generations before a convergence run gives up")
+    args = parser.parse_args()
+
+    print(f"{'length':>8} {'full':>14} {'incremental':>14} {'speedup':>8} "
+          f"{'converge at ' + str(args.mutation):>22} {'converge at 1/length':>22}")
+    for length in TARGET_LENGTHS:
+        # Random target phrase (like a whole paragraph of text) with the requested length
+        target = weasel_engine.create_random_sequence(length, np.random.default_rng(args.seed))
+
+        # The searches use the next seed, the same one would start them from the target itself
+        search_seed = args.seed + 1
+        full = measure(full_generation, target, args.copies, args.mutation, search_seed, args.duration)
+        incremental = measure(incremental_generation, target, args.copies, args.mutation, search_seed, args.duration)
+
+        if length <= args.converge_length:
+            fixed = converge(target, args.copies, args.mutation, search_seed, args.max_generations)
+            scaled = converge(target, args.copies, weasel_engine.scaled_mutation_rate(length), search_seed,
+                              args.max_generations)
+        else:
+            fixed = scaled = "-"
+
+        print(f"{length:>8} {full:>12.1f}/s {incremental:>12.1f}/s {incremental / full:>7.1f}x {fixed:>22} {scaled:>22}")
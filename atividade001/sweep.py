@@ -0,0 +1,125 @@
+# Parameter sweep for Dawkin's Weasel Algorithm
+#
+#   Runs every (population, mutation rate, target phrase) configuration of a grid N times across a process pool
+#   (one worker per core by default). Every trial gets its own independent random stream spawned from a single
+#   root seed, so a sweep is reproducible no matter how the trials are scheduled on the workers.
+#   The result is a CSV file with generations to converge and wall time aggregated over the trials.
+#
+import argparse
+import csv
+import itertools
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import atividade001
+import weasel_engine
+
+CSV_FIELDS = [
+    "engine", "target_phrase", "population", "mutation_rate", "trials",
+    "generations_mean", "generations_stdev", "generations_min", "generations_max",
+    "wall_time_mean", "wall_time_stdev",
+]
+
+
+# Run a single trial and return (generations to converge, wall time in seconds)
+def run_trial(task):
+    engine, target_phrase, population, mutation_rate, seed_sequence = task
+
+    start_time = time.perf_counter()
+    if engine == "numpy":
+        rng = np.random.default_rng(seed_sequence)
+        generations = weasel_engine.run(target_phrase, population, mutation_rate, rng, verbose=False)
+    else:
+        rng = random.Random(int.from_bytes(seed_sequence.generate_state(4).tobytes(), "little"))
+        generations = atividade001.run_weasel(target_phrase, population, mutation_rate, rng, verbose=False)
+    wall_time = time.perf_counter() - start_time
+
+    return generations, wall_time
+
+
+# Run every configuration of the grid trials times and return one aggregated row per configuration
+def run_sweep(populations, mutation_rates, target_phrases, trials, engine="numpy", seed=None, workers=None):
+    # Bad target phrases would never converge, reject them before any worker starts
+    for target_phrase in target_phrases:
+        weasel_engine.validate_target(target_phrase)
+    configurations = list(itertools.product(target_phrases, populations, mutation_rates))
+
+    # One independent random stream per trial, all spawned from the same root seed
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(configurations) * trials)
+
+    tasks = []
+    for index, (target_phrase, population, mutation_rate) in enumerate(configurations):
+        for trial in range(trials):
+            tasks.append((engine, target_phrase, population, mutation_rate, seed_sequences[index * trials + trial]))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run_trial, tasks, chunksize=max(1, len(tasks) // (4 * (workers or os.cpu_count())))))
+
+    rows = []
+    for index, (target_phrase, population, mutation_rate) in enumerate(configurations):
+        trial_results = results[index * trials:(index + 1) * trials]
+        generations = [result[0] for result in trial_results]
+        wall_times = [result[1] for result in trial_results]
+        rows.append({
+            "engine": engine,
+            "target_phrase": target_phrase,
+            "population": population,
+            "mutation_rate": "auto" if mutation_rate is None else mutation_rate,
+            "trials": trials,
+            "generations_mean": statistics.mean(generations),
+            "generations_stdev": statistics.stdev(generations) if trials > 1 else 0.0,
+            "generations_min": min(generations),
+            "generations_max": max(generations),
+            "wall_time_mean": statistics.mean(wall_times),
+            "wall_time_stdev": statistics.stdev(wall_times) if trials > 1 else 0.0,
+        })
+
+    return rows
+
+
+# Write the aggregated rows to a CSV file
+def write_csv(rows, path):
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+# Parse a comma separated list of numbers
+def number_list(number_type):
+    return lambda text: [number_type(value) for value in text.split(",")]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dawkin's Weasel Algorithm parameter sweep")
+    parser.add_argument("--populations", type=number_list(weasel_engine.positive_int), default=[50, 100, 200],
+                        help="comma separated quantities of copies")
+    parser.add_argument("--mutations", type=number_list(weasel_engine.mutation_rate), default=[0.01, 0.05, 0.1],
+                        help="comma separated chances of mutation ('auto' for 1/length of the target)")
+    parser.add_argument("--target", action="append", dest="targets",
+                        help="target phrase, can be repeated (default: METHINKS IT IS LIKE A WEASEL)")
+    parser.add_argument("--trials", type=weasel_engine.positive_int, default=10, help="trials per configuration")
+    parser.add_argument("--engine", choices=["numpy", "python"], default="numpy", help="algorithm implementation")
+    parser.add_argument("--seed", type=int, default=None, help="root seed for every trial (reproducible sweeps)")
+    parser.add_argument("--workers", type=weasel_engine.positive_int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--output", default="sweep.csv", help="CSV output file")
+    args = parser.parse_args()
+
+    for target_phrase in args.targets or []:
+        try:
+            weasel_engine.validate_target(target_phrase)
+        except ValueError as error:
+            parser.error(str(error))
+
+    start_time = time.perf_counter()
+    sweep_rows = run_sweep(args.populations, args.mutations, args.targets or [weasel_engine.TARGET_PHRASE],
+                           args.trials, args.engine, args.seed, args.workers)
+    write_csv(sweep_rows, args.output)
+
+    print(f"{len(sweep_rows)} configurations x {args.trials} trials written to {args.output} "
+          f"in {time.perf_counter() - start_time:.2f} seconds")
@@ -0,0 +1,218 @@
+# Dawkin's Weasel Algorithm - NumPy population engine
+#
+#   Same algorithm as atividade001.py, but the whole generation lives in a single
+#   (QUANTITY_OF_COPIES x len(TARGET_PHRASE)) uint8 array. Reproduction, mutation and scoring are each
+#   one batched NumPy operation instead of nested Python loops over every character of every copy.
+#
+import argparse
+import contextlib
+import time
+
+import numpy as np
+
+from weasel_trace import TraceWriter
+
+# 27 possible characters
+POSSIBLE_CHARACTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ "
+
+# Possible characters as byte codes, used to draw replacement characters in bulk
+ALPHABET = np.frombuffer(POSSIBLE_CHARACTERS.encode("ascii"), dtype=np.uint8)
+
+# Target phrase
+TARGET_PHRASE = "METHINKS IT IS LIKE A WEASEL"
+
+# Quantity of copies
+QUANTITY_OF_COPIES = 100
+
+# Chance of mutation
+CHANCE_OF_MUTATION = 0.05
+
+
+# Raise ValueError if the target phrase has characters that are not possible characters (it could never be reached)
+def validate_target(target_phrase):
+    invalid_characters = sorted(set(target_phrase) - set(POSSIBLE_CHARACTERS))
+    if invalid_characters:
+        raise ValueError(f"target phrase can only have characters A-Z and space, got {''.join(invalid_characters)!r}")
+    return target_phrase
+
+
+# Chance of mutation that changes about one character of every copy. The fixed CHANCE_OF_MUTATION changes 5% of
+# every copy, so with long targets (a 1000 characters target gets about 50 changes per copy) the mutations undo as
+# many matches as they make and the search levels off far from a full match
+def scaled_mutation_rate(length):
+    return 1 / max(length, 1)
+
+
+# Convert a phrase into a uint8 array of byte codes
+def encode_phrase(phrase):
+    return np.frombuffer(phrase.encode("ascii"), dtype=np.uint8).copy()
+
+
+# Convert a uint8 array of byte codes back into a phrase
+def decode_phrase(sequence):
+    return sequence.tobytes().decode("ascii")
+
+
+# Create a random sequence with the given length
+def create_random_sequence(length, rng):
+    return ALPHABET[rng.integers(0, len(ALPHABET), size=length)]
+
+
+#   2. Make copies of actual sequence (reproduction), one row per copy
+def create_population(sequence, quantity_of_copies):
+    return np.tile(sequence, (quantity_of_copies, 1))
+
+
+#   3. Change every character of every copy for a new random one with a chance of mutation (in place)
+def mutate_population(population, chance_of_mutation, rng):
+    mutation_mask = rng.random(population.shape) < chance_of_mutation
+    population[mutation_mask] = ALPHABET[rng.integers(0, len(ALPHABET), size=np.count_nonzero(mutation_mask))]
+    return population
+
+
+#   4. Give each copy a punctuation (quantity of characters in correct sequence and position)
+def calculate_points(population, target):
+    return np.count_nonzero(population == target, axis=-1)
+
+
+# Return the flat positions (copy * length + position) that mutate in a generation of total characters, sorted.
+#   The gaps between two mutations are geometric, so only the mutated positions are drawn, not one number per character
+def sample_mutation_sites(total, chance_of_mutation, rng):
+    if total == 0 or chance_of_mutation <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    expected = total * chance_of_mutation
+    sites = np.cumsum(rng.geometric(chance_of_mutation, size=int(expected + 6 * np.sqrt(expected) + 16))) - 1
+    while sites[-1] < total:
+        sites = np.concatenate((sites, sites[-1] + np.cumsum(rng.geometric(chance_of_mutation, size=len(sites)))))
+
+    return sites[:np.searchsorted(sites, total)]
+
+
+#   3. + 4. Mutate the copies and score them incrementally: every copy starts from the points of its parent and only
+#   the mutated positions are compared again with the target phrase. The copies are never materialized, only the
+#   highest punctuation one is applied in place over actual_sequence/actual_matches. Return its points.
+def evolve_incremental(actual_sequence, actual_matches, actual_points, target, quantity_of_copies, chance_of_mutation,
+                       rng):
+    sites = sample_mutation_sites(quantity_of_copies * len(target), chance_of_mutation, rng)
+    copies, positions = np.divmod(sites, len(target))
+    new_characters = ALPHABET[rng.integers(0, len(ALPHABET), size=len(sites))]
+    new_matches = new_characters == target[positions]
+
+    # Points gained and lost at the mutated positions of every copy
+    sequence_points = (actual_points
+                       + np.bincount(copies[new_matches], minlength=quantity_of_copies)
+                       - np.bincount(copies[actual_matches[positions]], minlength=quantity_of_copies))
+
+    # 5. Take the highest punctuation copy as the basis of next generation (sites are sorted, so its mutations are
+    #    a contiguous slice)
+    max_index = int(np.argmax(sequence_points))
+    first, last = np.searchsorted(copies, [max_index, max_index + 1])
+    actual_sequence[positions[first:last]] = new_characters[first:last]
+    actual_matches[positions[first:last]] = new_matches[first:last]
+
+    return int(sequence_points[max_index])
+
+
+# Run the algorithm until the target phrase is found and return the quantity of generations
+#   verbose=False runs quietly, print_every prints only one generation out of N (and the last one) and
+#   trace receives a (generation, best score, best string) record for every generation
+#   incremental=False scores every character of every copy again instead of only the mutated ones
+#   chance_of_mutation=None uses scaled_mutation_rate of the target length
+def run(target_phrase=TARGET_PHRASE, quantity_of_copies=QUANTITY_OF_COPIES, chance_of_mutation=CHANCE_OF_MUTATION,
+        rng=None, verbose=True, print_every=1, trace=None, incremental=True):
+    validate_target(target_phrase)
+    if rng is None:
+        rng = np.random.default_rng()
+
+    target = encode_phrase(target_phrase)
+    if chance_of_mutation is None:
+        chance_of_mutation = scaled_mutation_rate(len(target))
+    if not 0 < chance_of_mutation <= 1:
+        raise ValueError(f"chance of mutation must be greater than 0 and up to 1, got {chance_of_mutation}")
+
+    #   1. Create a random sequence of characters (phrase)
+    actual_sequence = create_random_sequence(len(target), rng)
+    actual_matches = actual_sequence == target
+    max_points = int(np.count_nonzero(actual_matches))
+
+    # Generation counter
+    generation = 0
+
+    # Repeat until a correct sequence is found (max_points == len(TARGET_PHRASE))
+    while max_points < len(target):
+        generation += 1
+
+        if incremental:
+            max_points = evolve_incremental(actual_sequence, actual_matches, max_points, target, quantity_of_copies,
+                                            chance_of_mutation, rng)
+        else:
+            population = create_population(actual_sequence, quantity_of_copies)
+            mutate_population(population, chance_of_mutation, rng)
+            sequence_points = calculate_points(population, target)
+
+            # 5. Take the highest punctuation phrase as the basis of next generation
+            max_index = int(np.argmax(sequence_points))
+            max_points = int(sequence_points[max_index])
+            actual_sequence = population[max_index]
+
+        if verbose and (generation % print_every == 0 or max_points == len(target)):
+            print(f"Generation: {generation} - {decode_phrase(actual_sequence)} - Points: {max_points}")
+
+        if trace is not None:
+            trace.write(generation, max_points, actual_sequence.tobytes())
+
+    return generation
+
+
+# argparse type for --mutation: a chance of mutation, or "auto" (None) for scaled_mutation_rate of the target length
+def mutation_rate(text):
+    if text == "auto":
+        return None
+    value = float(text)
+    if not 0 < value <= 1:
+        raise argparse.ArgumentTypeError(f"must be a chance greater than 0 and up to 1, or 'auto', got {value}")
+    return value
+
+
+# argparse type for options that must be a positive integer
+def positive_int(text):
+    value = int(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return value
+
+
+if __name__ == "__main__":
+    # Command line options
+    parser = argparse.ArgumentParser(description="Dawkin's Weasel Algorithm - NumPy population engine")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the random number generator (reproducible runs)")
+    parser.add_argument("--target", default=TARGET_PHRASE, help="target phrase (characters A-Z and space)")
+    parser.add_argument("--copies", type=int, default=QUANTITY_OF_COPIES, help="quantity of copies per generation")
+    parser.add_argument("--mutation", type=mutation_rate, default=CHANCE_OF_MUTATION,
+                        help="chance of mutation per character, or 'auto' for 1/length of the target (the fixed "
+                             "default only converges for short targets, use auto for long ones)")
+    parser.add_argument("--quiet", action="store_true", help="don't print the generations")
+    parser.add_argument("--print-every", type=positive_int, default=1, help="print only one generation out of N")
+    parser.add_argument("--trace", default=None, help="write every generation to a binary trace file")
+    parser.add_argument("--full-scoring", action="store_true", help="score every character of every copy again")
+    args = parser.parse_args()
+    try:
+        validate_target(args.target)
+    except ValueError as error:
+        parser.error(str(error))
+
+    # The trace is closed (and its buffered records written) even when the run is interrupted
+    with TraceWriter(args.trace, len(args.target)) if args.trace else contextlib.nullcontext() as trace:
+        # Start timer
+        start_time = time.perf_counter()
+
+        # Random number generator seeded only once for the whole run
+        run(args.target, args.copies, args.mutation, np.random.default_rng(args.seed), not args.quiet, args.print_every,
+            trace, not args.full_scoring)
+
+        # Elapsed time
+        elapsed_time = time.perf_counter() - start_time
+
+    # Print elapsed time
+    print(f"Target sequence acquired in {elapsed_time:.4f} seconds!!!")
@@ -0,0 +1,81 @@
+# Binary trace of a Dawkin's Weasel Algorithm run
+#
+#   A trace file is a small header followed by one fixed size record per generation:
+#       header: magic "WSLT", format version (uint8), target phrase length (uint32)
+#       record: generation (uint32), best score (uint32), best string (phrase length bytes)
+#   Records are buffered in memory and written in big chunks, so tracing does not slow the search down.
+#   Run this file to replay a trace, or to export it as CSV for plotting.
+#
+import argparse
+import csv
+import struct
+import sys
+
+TRACE_MAGIC = b"WSLT"
+TRACE_VERSION = 1
+TRACE_HEADER = struct.Struct("<4sBI")
+TRACE_RECORD = struct.Struct("<II")
+
+# Bytes kept in memory before they are written to the file
+TRACE_BUFFER_SIZE = 1 << 20
+
+
+class TraceWriter:
+    def __init__(self, path, phrase_length, buffer_size=TRACE_BUFFER_SIZE):
+        self.phrase_length = phrase_length
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+        self.file = open(path, "wb")
+        self.file.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, phrase_length))
+
+    # Append one (generation, best score, best string) record, best string as bytes
+    def write(self, generation, points, sequence_bytes):
+        self.buffer += TRACE_RECORD.pack(generation, points)
+        self.buffer += sequence_bytes
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        self.file.write(self.buffer)
+        self.buffer.clear()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Yield every (generation, best score, best string) record of a trace file
+def read_trace(path):
+    with open(path, "rb") as trace_file:
+        magic, version, phrase_length = TRACE_HEADER.unpack(trace_file.read(TRACE_HEADER.size))
+        if magic != TRACE_MAGIC or version != TRACE_VERSION:
+            raise ValueError(f"{path} is not a Weasel trace file (version {TRACE_VERSION})")
+
+        record_size = TRACE_RECORD.size + phrase_length
+        while True:
+            record = trace_file.read(record_size)
+            if len(record) < record_size:
+                break
+            generation, points = TRACE_RECORD.unpack_from(record)
+            yield generation, points, record[TRACE_RECORD.size:].decode("ascii")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a Weasel trace file")
+    parser.add_argument("trace", help="trace file written with --trace")
+    parser.add_argument("--csv", action="store_true", help="print generation,points,phrase as CSV (for plotting)")
+    args = parser.parse_args()
+
+    if args.csv:
+        writer = csv.writer(sys.stdout)
+        writer.writerow(["generation", "points", "phrase"])
+        writer.writerows(read_trace(args.trace))
+    else:
+        for generation, points, phrase in read_trace(args.trace):
+            print(f"Generation: {generation} - {phrase} - Points: {points}")
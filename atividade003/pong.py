@@ -1,19 +1,17 @@
-import math
 import os
-import platform
-import random
+import time
 import turtle
 
+import pong_core
+from pong_core import BOUNCE, SCORE, PongInputs, PongState
+from sound import SoundManager
 
-# Play a sound file with operating system identification
+
+# Play a sound file loaded at startup, without blocking the game
 def play_sound_file(sound_file, is_sound):
     if is_sound:
-        if os.path.exists(sound_file):
-            if platform.system() == "Darwin" or platform.system() == "Linux":
-                os.system(f"afplay {sound_file} &")
-            elif platform.system() == "Windows":
-                import winsound
-                winsound.PlaySound(sound_file, winsound.SND_ASYNC)
+        if sound_manager.has(sound_file):
+            sound_manager.play(sound_file)
         else:
             hud.clear()
             hud.write(f"Sound file doesn't exist: {sound_file}", align="center", font=("Arial", 24, "normal"))
@@ -22,34 +20,22 @@ def play_sound_file(sound_file, is_sound):
 
 # Move paddle up for player 1
 def paddle_1_up():
-    y = paddle_1.ycor()
-    if y < PADDLE_SCREEN_LIMIT:
-        y += PADDLE_MOVE_OFFSET
-    paddle_1.sety(min(y, PADDLE_SCREEN_LIMIT))
+    inputs.paddle_1 += 1
 
 
 # Move paddle down for player 1
 def paddle_1_down():
-    y = paddle_1.ycor()
-    if y > -PADDLE_SCREEN_LIMIT:
-        y -= PADDLE_MOVE_OFFSET
-    paddle_1.sety(max(y, -PADDLE_SCREEN_LIMIT))
+    inputs.paddle_1 -= 1
 
 
 # Move paddle up for player 2
 def paddle_2_up():
-    y = paddle_2.ycor()
-    if y < PADDLE_SCREEN_LIMIT:
-        y += PADDLE_MOVE_OFFSET
-    paddle_2.sety(min(y, PADDLE_SCREEN_LIMIT))
+    inputs.paddle_2 += 1
 
 
-# Move paddle down for player 1
+# Move paddle down for player 2
 def paddle_2_down():
-    y = paddle_2.ycor()
-    if y > -PADDLE_SCREEN_LIMIT:
-        y -= PADDLE_MOVE_OFFSET
-    paddle_2.sety(max(y, -PADDLE_SCREEN_LIMIT))
+    inputs.paddle_2 -= 1
 
 
 # Toggle for sound play
@@ -59,88 +45,125 @@ def sound_toggle():
     return None
 
 
-# Change ball direction with a random angle
-def ball_change_direction(direction):
-    speed = math.hypot(ball.dx, ball.dy) * BALL_ACCELERATION_RATE
-    angle = random.uniform(-math.pi / 4, math.pi / 4)
-    ball.dx = direction * abs(speed * math.cos(angle))
-    ball.dy = speed * math.sin(angle)
+# Play sounds for the events of a simulation step
+def handle_events(events):
+    for event in events:
+        if event == BOUNCE:
+            play_sound_file(BOUNCE_SOUND_FILE, is_sound_play)
+        elif event == SCORE:
+            play_sound_file(SCORE_SOUND_FILE, is_sound_play)
+
+
+# Draw the simulation state, pushing to the canvas only the items that changed since the last frame
+class DirtyRenderer:
+    def __init__(self):
+        # Last values drawn for each item (None forces the first draw)
+        self.ball_position = None
+        self.paddle_1_y = None
+        self.paddle_2_y = None
+        self.hud_key = None
+
+        # Frame time counter, shown in the window title once per FRAME_TIME_INTERVAL
+        self.frame_count = 0
+        self.frame_time = 0.0
+        self.updated_frames = 0
+        self.report_time = time.perf_counter()
+
+    # Rebuild the HUD text only when the score or the winner changed
+    def draw_hud(self):
+        hud_key = (state.score_1, state.score_2, state.winner)
+        if hud_key == self.hud_key:
+            return False
+        self.hud_key = hud_key
+
+        if state.winner:
+            text = f"Player {state.winner} WON!!! {state.score_1} : {state.score_2}"
+        else:
+            text = f"{state.score_1} : {state.score_2}"
+        hud.clear()
+        hud.write(text, align="center", font=("Arial", 24, "normal"))
+        return True
+
+    def render(self):
+        dirty = self.draw_hud()
+
+        ball_position = (state.ball_x, state.ball_y)
+        if ball_position != self.ball_position:
+            self.ball_position = ball_position
+            ball.goto(ball_position)
+            dirty = True
+
+        if state.paddle_1_y != self.paddle_1_y:
+            self.paddle_1_y = state.paddle_1_y
+            paddle_1.sety(state.paddle_1_y)
+            dirty = True
+
+        if state.paddle_2_y != self.paddle_2_y:
+            self.paddle_2_y = state.paddle_2_y
+            paddle_2.sety(state.paddle_2_y)
+            dirty = True
+
+        # Nothing moved, so there is nothing to push to the canvas
+        if dirty:
+            screen.update()
+            self.updated_frames += 1
+
+    # Add the time spent in one frame and show the average in the window title from time to time
+    def count_frame(self, frame_time):
+        self.frame_count += 1
+        self.frame_time += frame_time
+
+        now = time.perf_counter()
+        if now - self.report_time >= FRAME_TIME_INTERVAL:
+            screen.title(f"Pong With Turtle Lib - {self.frame_time / self.frame_count * 1000:.2f} ms/frame, "
+                         f"{self.updated_frames}/{self.frame_count} frames updated")
+            self.frame_count = 0
+            self.frame_time = 0.0
+            self.updated_frames = 0
+            self.report_time = now
 
 
 # Game main function
 def game():
-    global score_1, score_2, is_sound_play
-
-    # Update ball position
-    ball.setx(ball.xcor() + ball.dx)
-    ball.sety(ball.ycor() + ball.dy)
-
-    # Test top wall collision
-    if ball.ycor() > 290:
-        ball.sety(290)
-        ball.dy *= -1
-        play_sound_file(BOUNCE_SOUND_FILE, is_sound_play)
-
-    # Test bottom wall collision
-    if ball.ycor() < -290:
-        ball.sety(-290)
-        ball.dy *= -1
-        play_sound_file(BOUNCE_SOUND_FILE, is_sound_play)
-
-    # Player 1 score
-    if ball.xcor() > 390:
-        score_1 += 1
-        if score_1 == 10:
-            hud.clear()
-            hud.write(f"Player 1 WON!!! {score_1} : {score_2}", align="center", font=("Arial", 24, "normal"))
-            screen.exitonclick()
-        hud.clear()
-        hud.write(f"{score_1} : {score_2}", align="center", font=("Arial", 24, "normal"))
-        play_sound_file(SCORE_SOUND_FILE, is_sound_play)
-        ball.goto(0, 0)
-        ball.dx = BALL_INITIAL_SPEED
-        ball.dy = BALL_INITIAL_SPEED
-
-    # Player 2 score
-    if ball.xcor() < -390:
-        score_2 += 1
-        if score_2 == 10:
-            hud.clear()
-            hud.write(f"Player 2 WON!!! {score_1} : {score_2}", align="center", font=("Arial", 24, "normal"))
-            screen.exitonclick()
-        hud.clear()
-        hud.write(f"{score_1} : {score_2}", align="center", font=("Arial", 24, "normal"))
-        play_sound_file(SCORE_SOUND_FILE, is_sound_play)
-        ball.goto(0, 0)
-        ball.dx = BALL_INITIAL_SPEED
-        ball.dy = BALL_INITIAL_SPEED
-
-    # Test if ball colides with paddle 1
-    if (-350 < ball.xcor() < -330) and (paddle_1.ycor() - 50 < ball.ycor() < paddle_1.ycor() + 50):
-        ball.setx(-330)
-        play_sound_file(BOUNCE_SOUND_FILE, is_sound_play)
-        ball_change_direction(direction=1)
-
-    # Test if ball colides with paddle 2
-    if (330 < ball.xcor() < 350) and (paddle_2.ycor() - 50 < ball.ycor() < paddle_2.ycor() + 50):
-        ball.setx(330)
-        play_sound_file(BOUNCE_SOUND_FILE, is_sound_play)
-        ball_change_direction(direction=-1)
+    global last_time, accumulator
+
+    # Run as many fixed timesteps as the real time elapsed since the last frame
+    now = time.perf_counter()
+    frame_start = now
+    accumulator = min(accumulator + now - last_time, MAX_FRAME_TIME)
+    last_time = now
+    while accumulator >= pong_core.STEP_TIME:
+        accumulator -= pong_core.STEP_TIME
+        handle_events(pong_core.step(state, inputs))
+        inputs.paddle_1 = inputs.paddle_2 = 0
+
+    renderer.render()
+    renderer.count_frame(time.perf_counter() - frame_start)
+
+    if state.winner:
+        screen.exitonclick()
+        return
 
     # Update screen with an approximate rate of 60 FPS
-    screen.update()
     screen.ontimer(game, 16)  # Aproximadamente 60 FPS
 
 ### Game main source code
 # Constants used in application
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-PADDLE_MOVE_OFFSET = 30
-PADDLE_SCREEN_LIMIT = 250
-BALL_INITIAL_SPEED = 5
-BALL_ACCELERATION_RATE = 1.12
-SCORE_SOUND_FILE = "score.wav"
-BOUNCE_SOUND_FILE = "bounce.wav"
+SCREEN_WIDTH = pong_core.SCREEN_WIDTH
+SCREEN_HEIGHT = pong_core.SCREEN_HEIGHT
+SCORE_SOUND_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "score.wav")
+BOUNCE_SOUND_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bounce.wav")
+
+# Longest real time simulated in a single frame, so the game doesn't spiral after a freeze
+MAX_FRAME_TIME = 0.25
+
+# Seconds between two frame time reports in the window title
+FRAME_TIME_INTERVAL = 1.0
+
+# Decode sound files once (silent on machines without audio)
+sound_manager = SoundManager()
+sound_manager.load(SCORE_SOUND_FILE)
+sound_manager.load(BOUNCE_SOUND_FILE)
 
 # Initialize screen elements
 screen = turtle.Screen()
@@ -156,7 +179,7 @@ paddle_1.shape("square")
 paddle_1.color("white")
 paddle_1.shapesize(stretch_wid=5, stretch_len=1)
 paddle_1.penup()
-paddle_1.goto(-350, 0)
+paddle_1.goto(pong_core.PADDLE_1_X, 0)
 
 # Initialize paddle for player 2
 paddle_2 = turtle.Turtle()
@@ -165,7 +188,7 @@ paddle_2.shape("square")
 paddle_2.color("white")
 paddle_2.shapesize(stretch_wid=5, stretch_len=1)
 paddle_2.penup()
-paddle_2.goto(350, 0)
+paddle_2.goto(pong_core.PADDLE_2_X, 0)
 
 # Initialize ball
 ball = turtle.Turtle()
@@ -174,12 +197,12 @@ ball.shape("circle")
 ball.color("white")
 ball.penup()
 ball.goto(0, 0)
-ball.dx = BALL_INITIAL_SPEED
-ball.dy = BALL_INITIAL_SPEED
 
-# Variables for the score
-score_1 = 0
-score_2 = 0
+# Ball, paddles and score live in the simulation state, the turtles only draw it
+state = PongState()
+
+# Paddle moves pressed since the last simulation step
+inputs = PongInputs()
 
 # Variable to control sound play
 is_sound_play = True
@@ -192,7 +215,9 @@ hud.color("white")
 hud.penup()
 hud.hideturtle()
 hud.goto(0, 260)
-hud.write("0 : 0", align="center", font=("Arial", 24, "normal"))
+
+# Renderer that only redraws what changed (draws the "0 : 0" HUD on the first frame)
+renderer = DirtyRenderer()
 
 # Keyboard control functions
 screen.listen()
@@ -203,5 +228,7 @@ screen.onkeypress(paddle_2_down, "Down")
 screen.onkeypress(sound_toggle, "t")
 
 # Start game and put screen in loop
+last_time = time.perf_counter()
+accumulator = 0.0
 game()
 screen.mainloop()
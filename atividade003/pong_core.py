@@ -0,0 +1,171 @@
+import argparse
+import math
+import random
+import time
+from dataclasses import dataclass
+
+# Constants used in the simulation
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+PADDLE_MOVE_OFFSET = 30
+PADDLE_SCREEN_LIMIT = 250
+PADDLE_1_X = -350
+PADDLE_2_X = 350
+BALL_INITIAL_SPEED = 5
+BALL_ACCELERATION_RATE = 1.12
+WINNING_SCORE = 10
+
+# Fixed simulation timestep, the ball speed is given in pixels per step
+STEP_TIME = 0.016
+
+# Events returned by step
+BOUNCE = "bounce"
+SCORE = "score"
+WIN = "win"
+
+
+# Ball, paddles and score, with no turtle objects attached
+@dataclass
+class PongState:
+    ball_x: float = 0.0
+    ball_y: float = 0.0
+    ball_dx: float = BALL_INITIAL_SPEED
+    ball_dy: float = BALL_INITIAL_SPEED
+    paddle_1_y: float = 0.0
+    paddle_2_y: float = 0.0
+    score_1: int = 0
+    score_2: int = 0
+    winner: int = 0
+
+
+# Paddle moves requested since the last step: +1 for each move up, -1 for each move down
+@dataclass
+class PongInputs:
+    paddle_1: int = 0
+    paddle_2: int = 0
+
+
+# Move a paddle y coordinate by a quantity of moves, inside the screen limits
+def move_paddle(y, moves):
+    return max(-PADDLE_SCREEN_LIMIT, min(y + moves * PADDLE_MOVE_OFFSET, PADDLE_SCREEN_LIMIT))
+
+
+# Change ball direction with a random angle
+def ball_change_direction(state, direction, rng):
+    speed = math.hypot(state.ball_dx, state.ball_dy) * BALL_ACCELERATION_RATE
+    angle = rng.uniform(-math.pi / 4, math.pi / 4)
+    state.ball_dx = direction * abs(speed * math.cos(angle))
+    state.ball_dy = speed * math.sin(angle)
+
+
+# Put the ball back in the center with the initial speed
+def reset_ball(state):
+    state.ball_x = 0.0
+    state.ball_y = 0.0
+    state.ball_dx = BALL_INITIAL_SPEED
+    state.ball_dy = BALL_INITIAL_SPEED
+
+
+# Advance the game by one fixed timestep and return the list of events that happened (BOUNCE, SCORE, WIN)
+#   The state is updated in place; step has no I/O and doesn't depend on turtle, so it runs without a display
+def step(state, inputs, rng=random):
+    events = []
+    if state.winner:
+        return events
+
+    # Update paddle positions
+    if inputs.paddle_1:
+        state.paddle_1_y = move_paddle(state.paddle_1_y, inputs.paddle_1)
+    if inputs.paddle_2:
+        state.paddle_2_y = move_paddle(state.paddle_2_y, inputs.paddle_2)
+
+    # Update ball position
+    state.ball_x += state.ball_dx
+    state.ball_y += state.ball_dy
+
+    # Test top wall collision
+    if state.ball_y > 290:
+        state.ball_y = 290
+        state.ball_dy *= -1
+        events.append(BOUNCE)
+
+    # Test bottom wall collision
+    if state.ball_y < -290:
+        state.ball_y = -290
+        state.ball_dy *= -1
+        events.append(BOUNCE)
+
+    # Player 1 score
+    if state.ball_x > 390:
+        state.score_1 += 1
+        events.append(SCORE)
+        if state.score_1 == WINNING_SCORE:
+            state.winner = 1
+            events.append(WIN)
+        reset_ball(state)
+
+    # Player 2 score
+    if state.ball_x < -390:
+        state.score_2 += 1
+        events.append(SCORE)
+        if state.score_2 == WINNING_SCORE:
+            state.winner = 2
+            events.append(WIN)
+        reset_ball(state)
+
+    # Test if ball colides with paddle 1
+    if (-350 < state.ball_x < -330) and (state.paddle_1_y - 50 < state.ball_y < state.paddle_1_y + 50):
+        state.ball_x = -330
+        events.append(BOUNCE)
+        ball_change_direction(state, 1, rng)
+
+    # Test if ball colides with paddle 2
+    if (330 < state.ball_x < 350) and (state.paddle_2_y - 50 < state.ball_y < state.paddle_2_y + 50):
+        state.ball_x = 330
+        events.append(BOUNCE)
+        ball_change_direction(state, -1, rng)
+
+    return events
+
+
+# Simple bot: one move toward the ball when it is farther than half a move away
+def follow_ball(paddle_y, ball_y):
+    if ball_y > paddle_y + PADDLE_MOVE_OFFSET / 2:
+        return 1
+    if ball_y < paddle_y - PADDLE_MOVE_OFFSET / 2:
+        return -1
+    return 0
+
+
+# Play whole matches bot vs bot with no display and return (matches, rallies, steps)
+def simulate(matches, rng, reaction_steps=3):
+    rallies = 0
+    steps = 0
+    inputs = PongInputs()
+    for _ in range(matches):
+        state = PongState()
+        while not state.winner:
+            # Bots only react every reaction_steps, like a human pressing keys
+            if steps % reaction_steps == 0:
+                inputs.paddle_1 = follow_ball(state.paddle_1_y, state.ball_y)
+                inputs.paddle_2 = follow_ball(state.paddle_2_y, state.ball_y)
+            else:
+                inputs.paddle_1 = inputs.paddle_2 = 0
+            if SCORE in step(state, inputs, rng):
+                rallies += 1
+            steps += 1
+    return matches, rallies, steps
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless turtle Pong simulation (bot vs bot)")
+    parser.add_argument("--matches", type=int, default=1000, help="matches to simulate")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the ball directions")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    total_matches, total_rallies, total_steps = simulate(args.matches, random.Random(args.seed))
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f"{total_matches} matches, {total_rallies} rallies, {total_steps} steps in {elapsed_time:.2f} seconds")
+    print(f"{total_rallies / elapsed_time * 60:.0f} rallies per minute, {total_steps / elapsed_time:.0f} steps per second")
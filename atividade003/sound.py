@@ -0,0 +1,64 @@
+import os
+import platform
+
+
+# In-process sound effects for the turtle Pong, played without blocking the game loop
+#   The backend is pygame.mixer when it is available, winsound on Windows, and silent otherwise (headless
+#   machines, no audio device). Only the pygame backend decodes every sound file once, when it is loaded:
+#   winsound can't play a sound from memory asynchronously (SND_MEMORY with SND_ASYNC raises RuntimeError),
+#   so it reads the file again on every play.
+class SoundManager:
+    def __init__(self):
+        self.sounds = {}
+        self.backend = self._init_backend()
+
+    # Pick the first audio backend that works on this machine
+    def _init_backend(self):
+        try:
+            os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+            import pygame
+
+            pygame.mixer.init()
+            return "pygame"
+        except Exception:
+            pass
+
+        if platform.system() == "Windows":
+            return "winsound"
+
+        return "silent"
+
+    # Decode a sound file once (pygame backend), return False if it doesn't exist
+    def load(self, sound_file):
+        if not os.path.exists(sound_file):
+            return False
+
+        if self.backend == "pygame":
+            import pygame
+
+            try:
+                self.sounds[sound_file] = pygame.mixer.Sound(sound_file)
+            except pygame.error:
+                self.sounds[sound_file] = None
+        else:
+            # winsound plays straight from the file asynchronously (reading it on every play), silent mode has
+            # nothing to decode
+            self.sounds[sound_file] = sound_file
+        return True
+
+    # Verify if a sound file was loaded
+    def has(self, sound_file):
+        return sound_file in self.sounds
+
+    # Play a loaded sound file without waiting for it to finish
+    def play(self, sound_file):
+        sound = self.sounds.get(sound_file)
+        if sound is None:
+            return
+
+        if self.backend == "pygame":
+            sound.play()
+        elif self.backend == "winsound":
+            import winsound
+
+            winsound.PlaySound(sound, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
@@ -0,0 +1,83 @@
+import random
+from dataclasses import dataclass
+
+
+# How good an AI paddle is
+#   reaction_frames: frames waited after the ball changes direction before moving toward the new target
+#   error: largest distance (pixels) between the predicted intercept and where the AI decides to go
+@dataclass(frozen=True)
+class Difficulty:
+    reaction_frames: float
+    error: float
+
+
+DIFFICULTIES = {
+    "easy": Difficulty(reaction_frames=30, error=120),
+    "normal": Difficulty(reaction_frames=15, error=95),
+    "hard": Difficulty(reaction_frames=6, error=80),
+    "perfect": Difficulty(reaction_frames=0, error=0),
+}
+
+
+# Y (top of the ball) where a ball at (x, y) moving by (dx, dy) reaches target_x, bouncing between the walls at
+# min_y and max_y. Unfolding the bounces makes the path a straight line, so the answer is a triangle wave
+# folded back into [min_y, max_y]. Return None when the ball is moving away from target_x
+def predict_intercept_y(x, y, dx, dy, target_x, min_y, max_y):
+    if dx == 0:
+        return None
+    time = (target_x - x) / dx
+    if time < 0:
+        return None
+
+    span = max_y - min_y
+    if span <= 0:
+        return min_y
+    unfolded = (y + dy * time - min_y) % (2 * span)
+    if unfolded > span:
+        unfolded = 2 * span - unfolded
+    return min_y + unfolded
+
+
+# AI for one paddle: the intercept is solved once every time the ball changes direction (paddle hit or new
+# serve), wall bounces are part of the solution. Between hits the AI only walks its paddle to the target
+class PaddleAI:
+    def __init__(self, side, difficulty="normal", rng=None):
+        self.side = side  # -1: left paddle (player 1), 1: right paddle (player 2)
+        self.difficulty = DIFFICULTIES[difficulty] if isinstance(difficulty, str) else difficulty
+        self.rng = rng or random.Random()
+        self.last_ball_dx = None
+        self.target_y = None
+        self.reaction_timer = 0.0
+
+    # Solve where the ball will cross the paddle face and where the paddle center should go
+    def plan(self, ball, paddle, screen_height):
+        self.last_ball_dx = ball.dx
+        self.reaction_timer = self.difficulty.reaction_frames
+
+        if (ball.dx > 0) != (self.side > 0):
+            # Ball going to the other side: wait in the middle of the screen
+            self.target_y = screen_height / 2
+            return
+
+        face_x = paddle.rect.x - ball.width if self.side > 0 else paddle.rect.x + paddle.width
+        intercept_y = predict_intercept_y(ball.x, ball.y, ball.dx, ball.dy, face_x, 0, screen_height - ball.height)
+        if intercept_y is None:
+            self.target_y = screen_height / 2
+            return
+
+        error = self.rng.uniform(-self.difficulty.error, self.difficulty.error) if self.difficulty.error else 0
+        self.target_y = intercept_y + ball.height / 2 + error
+
+    # Return the direction to move the paddle this frame: -1 (up), 0 or 1 (down)
+    def direction(self, ball, paddle, screen_height, paddle_speed, dt=1.0):
+        if ball.dx != self.last_ball_dx:
+            self.plan(ball, paddle, screen_height)
+
+        if self.reaction_timer > 0:
+            self.reaction_timer -= dt
+            return 0
+
+        offset = self.target_y - (paddle.y + paddle.height / 2)
+        if abs(offset) <= paddle_speed * dt:
+            return 0
+        return 1 if offset > 0 else -1
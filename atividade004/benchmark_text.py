@@ -0,0 +1,63 @@
+# Benchmark: per-frame time of the Pong score HUD, rendering the text every frame vs. the text cache
+#
+#   Runs without a window (SDL dummy video driver) and only times the HUD part of a frame: building the
+#   score surface, getting its rect and blitting it. The score changes once every --frames-per-point frames.
+#
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from text_cache import TextCache
+
+COLOR_BLACK = (0, 0, 0)
+COLOR_WHITE = (255, 255, 255)
+FONT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "PressStart2P.ttf")
+
+
+# HUD of one frame as the Pong loop did it: render and get_rect every frame
+def uncached_hud(screen, score_font, score_1, score_2, _):
+    score_text = score_font.render(f"{score_1} x {score_2}", True, COLOR_WHITE, COLOR_BLACK)
+    screen.blit(score_text, score_text.get_rect(center=(680, 50)))
+
+
+# HUD of one frame as the Pong loop does it now: rebuild only when the score changes, through the cache
+def cached_hud(screen, score_font, score_1, score_2, hud):
+    if (score_1, score_2) != hud["score"]:
+        hud["score"] = (score_1, score_2)
+        hud["text"] = hud["cache"].render(score_font, f"{score_1} x {score_2}", True, COLOR_WHITE, COLOR_BLACK)
+        hud["rect"] = hud["text"].get_rect(center=(680, 50))
+    screen.blit(hud["text"], hud["rect"])
+
+
+# Run the HUD function for a whole simulated match and return the mean time per frame in microseconds
+def measure(hud_function, screen, score_font, frames, frames_per_point):
+    hud = {"score": None, "text": None, "rect": None, "cache": TextCache()}
+    start_time = time.perf_counter()
+    for frame in range(frames):
+        points = frame // frames_per_point
+        hud_function(screen, score_font, points // 2, points - points // 2, hud)
+    return (time.perf_counter() - start_time) / frames * 1_000_000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pong score HUD benchmark (time per frame)")
+    parser.add_argument("--frames", type=int, default=20_000, help="frames to simulate")
+    parser.add_argument("--frames-per-point", type=int, default=600, help="frames between two points")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    score_font = pygame.font.Font(FONT_FILE, 44)
+
+    uncached = measure(uncached_hud, screen, score_font, args.frames, args.frames_per_point)
+    cached = measure(cached_hud, screen, score_font, args.frames, args.frames_per_point)
+
+    print(f"render every frame: {uncached:8.2f} us/frame")
+    print(f"text cache:         {cached:8.2f} us/frame  ({uncached / cached:.1f}x)")
+
+    pygame.quit()
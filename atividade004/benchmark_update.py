@@ -0,0 +1,174 @@
+# Micro-benchmark: Pong update step with persistent objects vs. the old per-frame Rect allocation
+#
+#   Reports the mean time per update and the peak bytes allocated inside one update, so allocation churn in the
+#   update step can be tracked over time. Both run the same discrete physics and follow AI; the game's current
+#   update (swept collisions and predictive AI) is timed on its own line. Runs without a window (SDL dummy video driver).
+#
+import argparse
+import math
+import os
+import random
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+import pong
+
+ASSETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+
+# Old update step: three new Rects and repeated get_width()/get_height() calls every frame
+def legacy_update(state, player_1, player_2, ball):
+    ball_x, ball_y, ball_dx, ball_dy, ball_speed, player_1_y, player_2_y = state
+
+    if ball_y > pong.size[1] - ball.get_height():
+        ball_y = pong.size[1] - ball.get_height()
+        ball_dy *= -1
+    elif ball_y <= 0:
+        ball_y = 0
+        ball_dy *= -1
+
+    player_1_rect = pygame.Rect(50, player_1_y, player_1.get_width(), player_1.get_height())
+    player_2_rect = pygame.Rect(1180, player_2_y, player_2.get_width(), player_2.get_height())
+    ball_rect = pygame.Rect(ball_x, ball_y, ball.get_width(), ball.get_height())
+
+    if ball_rect.colliderect(player_1_rect) and ball_dx < 0:
+        rel = (ball_y + ball.get_height() / 2) - (player_1_y + player_1.get_height() / 2)
+        norm = rel / (player_1.get_height() / 2)
+        ball_speed = min(ball_speed + 0.5, 16)
+        ball_dx, ball_dy = pong.get_ball_velocity(ball_speed, norm * (math.pi / 3), 1)
+
+    if ball_rect.colliderect(player_2_rect) and ball_dx > 0:
+        rel = (ball_y + ball.get_height() / 2) - (player_2_y + player_2.get_height() / 2)
+        norm = rel / (player_2.get_height() / 2)
+        ball_speed = min(ball_speed + 0.5, 16)
+        ball_dx, ball_dy = pong.get_ball_velocity(ball_speed, norm * (math.pi / 3), -1)
+
+    if ball_x < -50 or ball_x > 1320:
+        ball_x, ball_y, ball_speed = 640, 360, 7
+        ball_dx, ball_dy = pong.get_ball_velocity(ball_speed, random.uniform(-math.pi / 4, math.pi / 4),
+                                                  1 if ball_x < -50 else -1)
+
+    ball_x += ball_dx
+    ball_y += ball_dy
+
+    if player_2_y + player_2.get_height() // 2 < ball_y:
+        player_2_y += 5
+    elif player_2_y + player_2.get_height() // 2 > ball_y:
+        player_2_y -= 5
+    if player_2_y <= 0:
+        player_2_y = 0
+    elif player_2_y >= pong.size[1] - player_2.get_height():
+        player_2_y = pong.size[1] - player_2.get_height()
+
+    return ball_x, ball_y, ball_dx, ball_dy, ball_speed, player_1_y, player_2_y
+
+
+# Same discrete step as legacy_update (move by one frame, overlap checks, simple follow AI) on the persistent
+# pong.Paddle and pong.Ball objects, so the comparison with legacy_update only measures the Rect allocation
+def persistent_update(ball, player_1, player_2):
+    # Ball collision with the wall
+    if ball.y > ball.max_y:
+        ball.set_position(ball.x, ball.max_y)
+        ball.dy *= -1
+    elif ball.y <= 0:
+        ball.set_position(ball.x, 0)
+        ball.dy *= -1
+
+    # Ball collision with the players
+    if ball.dx < 0 and ball.rect.colliderect(player_1.rect):
+        ball.hit_paddle(player_1, 1)
+    if ball.dx > 0 and ball.rect.colliderect(player_2.rect):
+        ball.hit_paddle(player_2, -1)
+
+    # Scoring points
+    if ball.x < -50:
+        ball.reset(1)
+    elif ball.x > 1320:
+        ball.reset(-1)
+
+    ball.set_position(ball.x + ball.dx, ball.y + ball.dy)
+
+    # Player 2 follows the ball
+    if player_2.y + player_2.height // 2 < ball.y:
+        player_2.move(pong.PADDLE_SPEED)
+    elif player_2.y + player_2.height // 2 > ball.y:
+        player_2.move(-pong.PADDLE_SPEED)
+
+
+# Call step frames times and return the microseconds per update
+def measure_time(step, frames):
+    step()
+    start_time = time.perf_counter()
+    for _ in range(frames):
+        step()
+    return (time.perf_counter() - start_time) / frames * 1_000_000
+
+
+# Return the peak of memory traced while running one update, in bytes (every object created in the update
+# is alive at the same time at least once, so this grows with the allocations of a frame)
+def measure_allocations(step, frames):
+    step()
+    tracemalloc.start()
+    peak = 0
+    for _ in range(frames):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        step()
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+    return peak
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pong update step micro-benchmark")
+    parser.add_argument("--frames", type=int, default=200_000, help="update steps to run")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the ball angles")
+    args = parser.parse_args()
+
+    paddle_image = pygame.image.load(os.path.join(ASSETS_PATH, "player.png"))
+    ball_image = pygame.image.load(os.path.join(ASSETS_PATH, "ball.png"))
+
+    random.seed(args.seed)
+    legacy_state = [640, 360, pong.BALL_INITIAL_SPEED, 0.0, pong.BALL_INITIAL_SPEED, 300, 300]
+
+    def legacy_step():
+        global legacy_state
+        legacy_state = legacy_update(legacy_state, paddle_image, paddle_image, ball_image)
+
+    random.seed(args.seed)
+    persistent_ball = pong.Ball(ball_image)
+    persistent_player_1 = pong.Paddle(paddle_image, pong.PLAYER_1_X, 300)
+    persistent_player_2 = pong.Paddle(paddle_image, pong.PLAYER_2_X, 300)
+
+    def persistent_step():
+        persistent_update(persistent_ball, persistent_player_1, persistent_player_2)
+
+    # The game's own update: swept ball collisions and the predictive AI on top of the persistent objects
+    random.seed(args.seed)
+    player_1 = pong.Paddle(paddle_image, pong.PLAYER_1_X, 300)
+    player_2 = pong.Paddle(paddle_image, pong.PLAYER_2_X, 300)
+    ball = pong.Ball(ball_image)
+
+    player_2_ai = pong.PaddleAI(1, "perfect")
+
+    def current_step():
+        player_2_direction = player_2_ai.direction(ball, player_2, pong.size[1], pong.PADDLE_SPEED)
+        pong.update(ball, player_1, player_2, 0, player_2_direction)
+
+    legacy_time = measure_time(legacy_step, args.frames)
+    persistent_time = measure_time(persistent_step, args.frames)
+    current_time = measure_time(current_step, args.frames)
+    legacy_bytes = measure_allocations(legacy_step, min(args.frames, 10_000))
+    persistent_bytes = measure_allocations(persistent_step, min(args.frames, 10_000))
+    current_bytes = measure_allocations(current_step, min(args.frames, 10_000))
+
+    print(f"per-frame Rects:   {legacy_time:6.2f} us/update  {legacy_bytes:5d} bytes allocated at peak")
+    print(f"persistent rects:  {persistent_time:6.2f} us/update  {persistent_bytes:5d} bytes allocated at peak "
+          f"({legacy_time / persistent_time:.1f}x faster)")
+    print(f"sweep + AI update: {current_time:6.2f} us/update  {current_bytes:5d} bytes allocated at peak "
+          f"(+{current_time - persistent_time:.2f} us for the swept collisions and predictive AI)")
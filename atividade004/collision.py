@@ -0,0 +1,57 @@
+import math
+
+# Result of a sweep that doesn't hit anything during the movement
+NO_HIT = (math.inf, 0, 0)
+
+
+# Swept AABB test: box (x, y, w, h) moves by (dx, dy) during a step, the other box (ox, oy, ow, oh) is still.
+#   Return (time, normal_x, normal_y): time is the fraction of the movement, from 0 to 1, where the boxes start
+#   touching, and the normal is the face of the other box that was hit. Return NO_HIT when they don't touch
+#   during the movement, or when they already overlap at the start (that case is left to a discrete test).
+def sweep_aabb(x, y, w, h, dx, dy, ox, oy, ow, oh):
+    # Times where the box enters and leaves the other box on the x axis
+    if dx > 0:
+        x_entry = (ox - (x + w)) / dx
+        x_exit = (ox + ow - x) / dx
+    elif dx < 0:
+        x_entry = (ox + ow - x) / dx
+        x_exit = (ox - (x + w)) / dx
+    elif x + w <= ox or x >= ox + ow:
+        return NO_HIT
+    else:
+        x_entry = -math.inf
+        x_exit = math.inf
+
+    # Times where the box enters and leaves the other box on the y axis
+    if dy > 0:
+        y_entry = (oy - (y + h)) / dy
+        y_exit = (oy + oh - y) / dy
+    elif dy < 0:
+        y_entry = (oy + oh - y) / dy
+        y_exit = (oy - (y + h)) / dy
+    elif y + h <= oy or y >= oy + oh:
+        return NO_HIT
+    else:
+        y_entry = -math.inf
+        y_exit = math.inf
+
+    # The boxes touch only while both axes overlap
+    entry = max(x_entry, y_entry)
+    exit = min(x_exit, y_exit)
+    if entry > exit or entry < 0 or entry > 1:
+        return NO_HIT
+
+    if x_entry > y_entry:
+        return entry, (-1 if dx > 0 else 1), 0
+    return entry, 0, (-1 if dy > 0 else 1)
+
+
+# Time (fraction of the movement, from 0 to 1) where a box edge at position p moving by d reaches the line at
+# limit, or math.inf when it doesn't during the movement
+def sweep_to_line(p, d, limit):
+    if d == 0:
+        return math.inf
+    t = (limit - p) / d
+    if 0 <= t <= 1:
+        return t
+    return math.inf
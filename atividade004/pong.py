@@ -0,0 +1,286 @@
+import pygame
+import random
+import math
+
+from ai import PaddleAI
+from collision import sweep_aabb, sweep_to_line
+from text_cache import render_text
+
+COLOR_BLACK = (0, 0, 0)
+COLOR_WHITE = (255, 255, 255)
+SCORE_MAX = 2
+
+size = (1280, 720)
+
+# Paddles
+PLAYER_1_X = 50
+PLAYER_2_X = 1180
+PADDLE_SPEED = 5
+
+# Robot paddle difficulty: "easy", "normal", "hard" or "perfect"
+AI_DIFFICULTY = "normal"
+
+# Ball
+BALL_INITIAL_SPEED = 7
+BALL_SPEED_INCREMENT = 0.5
+BALL_MAX_SPEED = 16
+
+# Simulation speeds are given per frame at 60 FPS, update receives the elapsed time in these frames
+FRAME_TIME_MS = 1000 / 60
+
+# Longest elapsed time simulated by a single update (after a freeze or while dragging the window)
+MAX_FRAME_DT = 4.0
+
+# Most collisions resolved inside a single update, so the ball can't bounce forever in one step
+MAX_COLLISIONS = 4
+
+# Events returned by update (bit flags, so no list is allocated every frame)
+BOUNCE = 1
+SCORE_1 = 2
+SCORE_2 = 4
+
+
+# Calculate dx, dy from speed and angle
+def get_ball_velocity(speed, angle, direction):
+    dx = speed * math.cos(angle) * direction
+    dy = speed * math.sin(angle)
+    return dx, dy
+
+
+# Paddle with its image size read once and a rect that is updated in place
+class Paddle:
+    def __init__(self, image, x, y):
+        self.image = image
+        self.width = image.get_width()
+        self.height = image.get_height()
+        self.max_y = size[1] - self.height
+        self.y = y
+        self.rect = pygame.Rect(x, y, self.width, self.height)
+
+    def move(self, dy):
+        self.y += dy
+        # Clamp paddle
+        if self.y <= 0:
+            self.y = 0
+        elif self.y >= self.max_y:
+            self.y = self.max_y
+        self.rect.y = self.y
+
+
+# Ball with its image size read once and a rect that is updated in place
+class Ball:
+    def __init__(self, image):
+        self.image = image
+        self.width = image.get_width()
+        self.height = image.get_height()
+        self.max_y = size[1] - self.height
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.x = self.y = 0
+        self.speed = BALL_INITIAL_SPEED
+        self.dx = self.dy = 0
+        self.reset(random.choice([1, -1]))  # 1: right, -1: left
+
+    def set_position(self, x, y):
+        self.x = x
+        self.y = y
+        self.rect.x = x
+        self.rect.y = y
+
+    # Put the ball in the center with a random angle
+    def reset(self, direction):
+        self.set_position(640, 360)
+        self.speed = BALL_INITIAL_SPEED
+        angle = random.uniform(-math.pi / 4, math.pi / 4)
+        self.dx, self.dy = get_ball_velocity(self.speed, angle, direction)
+
+    # Bounce the ball back with an angle that depends on where it hit the paddle
+    def hit_paddle(self, paddle, direction):
+        # Calculate hit position on the paddle (relative to center)
+        rel = (self.y + self.height / 2) - (paddle.y + paddle.height / 2)
+        norm = rel / (paddle.height / 2)
+        bounce_angle = norm * (math.pi / 3)  # Max 60 degrees
+        self.speed = min(self.speed + BALL_SPEED_INCREMENT, BALL_MAX_SPEED)  # Increase speed, cap at 16
+        self.dx, self.dy = get_ball_velocity(self.speed, bounce_angle, direction)
+
+
+# Move the ball by dt frames, stopping at the exact time of impact of every wall or paddle hit inside the step,
+# so it can't pass through a paddle at any speed or frame time. Return the events (BOUNCE)
+def move_ball(ball, player_1, player_2, dt):
+    events = 0
+    remaining = dt
+
+    for _ in range(MAX_COLLISIONS):
+        dx = ball.dx * remaining
+        dy = ball.dy * remaining
+
+        # Time of impact with the wall the ball is moving toward
+        if dy < 0:
+            time = sweep_to_line(ball.y, dy, 0)
+        else:
+            time = sweep_to_line(ball.y, dy, ball.max_y)
+
+        # Time of impact with the paddle the ball is moving toward
+        paddle, direction = (player_1, 1) if ball.dx < 0 else (player_2, -1)
+        paddle_time, _, _ = sweep_aabb(ball.x, ball.y, ball.width, ball.height, dx, dy,
+                                       paddle.rect.x, paddle.y, paddle.width, paddle.height)
+        hit_paddle = paddle_time <= time
+        time = min(time, paddle_time)
+
+        if time > 1:
+            break
+
+        # Move to the impact point, bounce and keep moving for the rest of the step
+        ball.set_position(ball.x + dx * time, ball.y + dy * time)
+        remaining *= 1 - time
+        if hit_paddle:
+            ball.hit_paddle(paddle, direction)
+        else:
+            ball.dy *= -1
+        events |= BOUNCE
+
+    ball.set_position(ball.x + ball.dx * remaining, ball.y + ball.dy * remaining)
+    return events
+
+
+# Advance the game by dt frames (1.0 = one frame at 60 FPS) and return the events that happened
+# (BOUNCE, SCORE_1, SCORE_2). Paddle directions are -1 (up), 0 or 1 (down)
+def update(ball, player_1, player_2, player_1_direction, player_2_direction, dt=1.0):
+    events = 0
+
+    # Ball collision with the wall
+    if ball.y > ball.max_y:
+        ball.set_position(ball.x, ball.max_y)
+        ball.dy *= -1
+        events |= BOUNCE
+    elif ball.y <= 0:
+        ball.set_position(ball.x, 0)
+        ball.dy *= -1
+        events |= BOUNCE
+
+    # Paddle moved over the ball (hits that happen while the ball moves are found by move_ball)
+    if ball.dx < 0 and ball.rect.colliderect(player_1.rect):
+        ball.hit_paddle(player_1, 1)
+        events |= BOUNCE
+    if ball.dx > 0 and ball.rect.colliderect(player_2.rect):
+        ball.hit_paddle(player_2, -1)
+        events |= BOUNCE
+
+    # Scoring points
+    if ball.x < -50:
+        ball.reset(1)
+        events |= SCORE_2
+    elif ball.x > 1320:
+        ball.reset(-1)
+        events |= SCORE_1
+
+    # Ball movement
+    events |= move_ball(ball, player_1, player_2, dt)
+
+    # Paddles movement
+    player_1.move(player_1_direction * PADDLE_SPEED * dt)
+    player_2.move(player_2_direction * PADDLE_SPEED * dt)
+
+    return events
+
+
+def main():
+    pygame.init()
+
+    screen = pygame.display.set_mode(size)
+    pygame.display.set_caption("MyPong - PyGame Edition - 2024-09-02")
+
+    # Score text
+    score_font = pygame.font.Font('assets/PressStart2P.ttf', 44)
+    score_text = render_text(score_font, '00 x 00', True, COLOR_WHITE, COLOR_BLACK)
+    score_text_rect = score_text.get_rect(center=(680, 50))
+    shown_score = None
+
+    # Victory text
+    victory_font = pygame.font.Font('assets/PressStart2P.ttf', 100)
+    victory_text = victory_font.render('VICTORY', True, COLOR_WHITE, COLOR_BLACK)
+    victory_text_rect = victory_text.get_rect(center=(640, 350))  # Center of screen
+
+    # Sound effects
+    bounce_sound_effect = pygame.mixer.Sound('assets/bounce.wav')
+    scoring_sound_effect = pygame.mixer.Sound('assets/258020__kodack__arcade-bleep-sound.wav')
+
+    # Player 1
+    player_1 = Paddle(pygame.image.load("assets/player.png"), PLAYER_1_X, 300)
+    player_1_move_up = False
+    player_1_move_down = False
+
+    # Player 2 - robot
+    player_2 = Paddle(pygame.image.load("assets/player.png"), PLAYER_2_X, 300)
+    player_2_ai = PaddleAI(1, AI_DIFFICULTY)
+
+    # Ball
+    ball = Ball(pygame.image.load("assets/ball.png"))
+
+    # Score
+    score_1 = 0
+    score_2 = 0
+
+    # Game loop
+    game_loop = True
+    game_clock = pygame.time.Clock()
+    dt = 1.0
+
+    while game_loop:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                game_loop = False
+
+            # Keystroke events
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_UP:
+                    player_1_move_up = True
+                if event.key == pygame.K_DOWN:
+                    player_1_move_down = True
+            if event.type == pygame.KEYUP:
+                if event.key == pygame.K_UP:
+                    player_1_move_up = False
+                if event.key == pygame.K_DOWN:
+                    player_1_move_down = False
+
+        # Checking the victory condition
+        if score_1 < SCORE_MAX and score_2 < SCORE_MAX:
+            # Clear screen
+            screen.fill(COLOR_BLACK)
+
+            player_2_direction = player_2_ai.direction(ball, player_2, size[1], PADDLE_SPEED, dt)
+            events = update(ball, player_1, player_2, player_1_move_down - player_1_move_up, player_2_direction, dt)
+            if events & BOUNCE:
+                bounce_sound_effect.play()
+            if events & SCORE_1:
+                score_1 += 1
+            if events & SCORE_2:
+                score_2 += 1
+            if events & (SCORE_1 | SCORE_2):
+                scoring_sound_effect.play()
+
+            # Update score HUD (only when the score changed)
+            if (score_1, score_2) != shown_score:
+                shown_score = (score_1, score_2)
+                score_text = render_text(score_font, f"{score_1} x {score_2}", True, COLOR_WHITE, COLOR_BLACK)
+                score_text_rect = score_text.get_rect(center=(680, 50))
+
+            # Drawing objects
+            screen.blit(ball.image, ball.rect)
+            screen.blit(player_1.image, player_1.rect)
+            screen.blit(player_2.image, player_2.rect)
+            screen.blit(score_text, score_text_rect)
+        else:
+            # Drawing victory
+            screen.fill(COLOR_BLACK)
+            screen.blit(score_text, score_text_rect)
+            screen.blit(victory_text, victory_text_rect)
+
+        # Update screen
+        pygame.display.flip()
+        dt = min(game_clock.tick(60) / FRAME_TIME_MS, MAX_FRAME_DT)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# Headless batch match simulator for the pygame Pong
+#
+#   Plays AI vs AI matches as fast as possible: SDL dummy video driver, no audio, no fonts, no clock throttling
+#   and no render path. Reports matches per second and writes per-match statistics to a CSV file.
+#
+import argparse
+import csv
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+import pong
+from ai import DIFFICULTIES, PaddleAI
+
+ASSETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+
+CSV_FIELDS = [
+    "match", "winner", "score_1", "score_2", "frames", "points",
+    "rally_frames_mean", "rally_frames_max", "rally_hits_mean", "rally_hits_max",
+    "speed_at_point_mean", "speed_at_point_max",
+]
+
+
+# Play one match and return its statistics
+def play_match(match, paddle_image, ball_image, difficulty_1, difficulty_2, score_max, dt, max_frames, rng):
+    player_1 = pong.Paddle(paddle_image, pong.PLAYER_1_X, 300)
+    player_2 = pong.Paddle(paddle_image, pong.PLAYER_2_X, 300)
+    ball = pong.Ball(ball_image)
+    player_1_ai = PaddleAI(-1, difficulty_1, random.Random(rng.random()))
+    player_2_ai = PaddleAI(1, difficulty_2, random.Random(rng.random()))
+
+    score_1 = score_2 = 0
+    frames = 0
+    rally_frames = []
+    rally_hits = []
+    speeds_at_point = []
+    rally_start = 0
+    hits = 0
+
+    while score_1 < score_max and score_2 < score_max and frames < max_frames:
+        speed = ball.speed
+        ball_dx = ball.dx
+        events = pong.update(ball, player_1, player_2,
+                             player_1_ai.direction(ball, player_1, pong.size[1], pong.PADDLE_SPEED, dt),
+                             player_2_ai.direction(ball, player_2, pong.size[1], pong.PADDLE_SPEED, dt),
+                             dt)
+        frames += 1
+
+        if events & (pong.SCORE_1 | pong.SCORE_2):
+            if events & pong.SCORE_1:
+                score_1 += 1
+            else:
+                score_2 += 1
+            rally_frames.append(frames - rally_start)
+            rally_hits.append(hits)
+            speeds_at_point.append(speed)
+            rally_start = frames
+            hits = 0
+        elif (ball.dx > 0) != (ball_dx > 0):
+            hits += 1
+
+    winner = 1 if score_1 > score_2 else 2 if score_2 > score_1 else 0
+    return {
+        "match": match,
+        "winner": winner,
+        "score_1": score_1,
+        "score_2": score_2,
+        "frames": frames,
+        "points": len(rally_frames),
+        "rally_frames_mean": statistics.mean(rally_frames) if rally_frames else 0,
+        "rally_frames_max": max(rally_frames, default=0),
+        "rally_hits_mean": statistics.mean(rally_hits) if rally_hits else 0,
+        "rally_hits_max": max(rally_hits, default=0),
+        "speed_at_point_mean": statistics.mean(speeds_at_point) if speeds_at_point else 0,
+        "speed_at_point_max": max(speeds_at_point, default=0),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless Pong AI vs AI match simulator")
+    parser.add_argument("--matches", type=int, default=1000, help="matches to play")
+    parser.add_argument("--player-1", choices=DIFFICULTIES, default="normal", help="player 1 AI difficulty")
+    parser.add_argument("--player-2", choices=DIFFICULTIES, default="normal", help="player 2 AI difficulty")
+    parser.add_argument("--score-max", type=int, default=pong.SCORE_MAX, help="points to win a match")
+    parser.add_argument("--dt", type=float, default=1.0, help="frames (at 60 FPS) simulated per physics step")
+    parser.add_argument("--max-frames", type=int, default=200_000, help="frames before a match is called a draw")
+    parser.add_argument("--seed", type=int, default=None, help="seed for serves and AI errors")
+    parser.add_argument("--output", default="matches.csv", help="CSV file for the per-match statistics")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    match_rng = random.Random(args.seed)
+    paddle_image = pygame.image.load(os.path.join(ASSETS_PATH, "player.png"))
+    ball_image = pygame.image.load(os.path.join(ASSETS_PATH, "ball.png"))
+
+    start_time = time.perf_counter()
+    results = [
+        play_match(match, paddle_image, ball_image, args.player_1, args.player_2, args.score_max, args.dt,
+                   args.max_frames, match_rng)
+        for match in range(args.matches)
+    ]
+    elapsed_time = time.perf_counter() - start_time
+
+    with open(args.output, "w", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+    wins_1 = sum(result["winner"] == 1 for result in results)
+    wins_2 = sum(result["winner"] == 2 for result in results)
+    total_frames = sum(result["frames"] for result in results)
+    print(f"{args.matches} matches in {elapsed_time:.2f} seconds: {args.matches / elapsed_time:.1f} matches/s, "
+          f"{total_frames / elapsed_time:.0f} frames/s")
+    print(f"player 1 ({args.player_1}): {wins_1} wins, player 2 ({args.player_2}): {wins_2} wins, "
+          f"{args.matches - wins_1 - wins_2} draws")
+    print(f"statistics written to {args.output}")
@@ -2,16 +2,31 @@ import pygame
 import random
 import os
 import math
+import time
+import argparse
 
-# Initialize pygame and mixer
+import numpy as np
+
+from levels import GeneratedPack, LevelPack
+from sound_bank import SoundBank
+from text_cache import render_text
+
+# Initialize pygame (the mixer is started by the sound bank, the game runs silent without it)
 pygame.init()
-pygame.mixer.init()
 
 # Screen dimensions
 SCREEN_WIDTH = 600
 SCREEN_HEIGHT = 800
 FPS = 60
 
+# The simulation always advances in steps of STEP_TIME seconds (speeds are given per step),
+# rendering runs once per loop and interpolates between the last two steps
+STEP_TIME = 1 / FPS
+# Longest real time simulated in one loop iteration (after a freeze or while dragging the window)
+MAX_FRAME_TIME = 0.25
+# Seconds between two simulation/render time reports in the window title
+STATS_INTERVAL = 1.0
+
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -30,6 +45,17 @@ PADDLE_SPEED = 8
 # Ball
 BALL_RADIUS = 10
 BALL_SPEED = 10
+# Most balls in play at once (multi-ball splits stop when the pool is full)
+MAX_BALLS = 512
+
+# Multi-ball power-up: chance that a destroyed brick drops a capsule, how fast it falls,
+# and the angle between a ball and the two copies it splits into when the paddle catches one
+MULTIBALL_CHANCE = 0.1
+CAPSULE_WIDTH = 30
+CAPSULE_HEIGHT = 12
+CAPSULE_SPEED = 3
+CAPSULE_COLOR = (200, 80, 220)
+SPLIT_ANGLE = math.radians(20)
 
 # Brick
 BRICK_ROWS = 6
@@ -38,6 +64,16 @@ BRICK_WIDTH = SCREEN_WIDTH // BRICK_COLS
 BRICK_HEIGHT = 30
 BRICK_PADDING = 5
 TOP_OFFSET = 60
+# Height available for the wall, rows of bigger levels get shorter to fit in it
+BRICK_AREA_HEIGHT = SCREEN_HEIGHT // 2 - TOP_OFFSET
+
+# Keys held during a simulation step, as bits of one byte per step in input recordings
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_RESTART = 4
+
+# Level files, played in file name order (see levels.py for the format)
+LEVELS_PATH = os.path.join(os.path.dirname(__file__), "levels")
 
 # Set up display
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -46,29 +82,21 @@ pygame.display.set_caption("Breakout Game with Sound")
 # Clock
 clock = pygame.time.Clock()
 
-# SOUND SETUP
-def load_sound(filename, fallback_beep=False):
-    try:
-        return pygame.mixer.Sound(filename)
-    except:
-        if fallback_beep:
-            # Create a beep using array
-            arr = pygame.sndarray.make_sound(
-                (pygame.surfarray.pixels2d(pygame.Surface((1, 1))) * 0 + 127).astype('int16')
-            )
-            return arr
-        return None
-
-# use .wav files, or fallback to beeps
-ASSETS_PATH = os.path.join(os.path.dirname(__file__), "assets")
-BOUNCE_SOUND = load_sound(os.path.join(ASSETS_PATH, "bounce.wav"), fallback_beep=True)
-BRICK_SOUND = load_sound(os.path.join(ASSETS_PATH, "brick.wav"), fallback_beep=True)
-GAMEOVER_SOUND = load_sound(os.path.join(ASSETS_PATH, "gameover.wav"), fallback_beep=True)
-WIN_SOUND = load_sound(os.path.join(ASSETS_PATH, "win.wav"), fallback_beep=True)
+# Sounds, decoded once at startup (the files live in "assents", "assets" is also searched).
+# Missing files get a synthesized beep: (start frequency, end frequency, seconds)
+ASSETS_FOLDERS = [os.path.join(os.path.dirname(os.path.abspath(__file__)), folder) for folder in ("assents", "assets")]
+BOUNCE_SOUND = "bounce"
+BRICK_SOUND = "brick"
+GAMEOVER_SOUND = "gameover"
+WIN_SOUND = "win"
+SOUNDS = SoundBank(ASSETS_FOLDERS)
+SOUNDS.load(BOUNCE_SOUND, "bounce.wav", (660, 660, 0.06))
+SOUNDS.load(BRICK_SOUND, "brick.wav", (880, 1100, 0.05))
+SOUNDS.load(GAMEOVER_SOUND, "gameover.wav", (440, 110, 0.6))
+SOUNDS.load(WIN_SOUND, "win.wav", (523, 1047, 0.5))
 
 def play_sound(sound):
-    if sound:
-        sound.play()
+    SOUNDS.play(sound)
 
 class Paddle:
     def __init__(self):
@@ -78,6 +106,7 @@ class Paddle:
         self.y = SCREEN_HEIGHT - 40
         self.speed = PADDLE_SPEED
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.prev_x = self.x
 
     def move(self, dir):
         if dir == "LEFT":
@@ -87,206 +116,556 @@ class Paddle:
         self.x = max(0, min(self.x, SCREEN_WIDTH - self.width))
         self.rect.x = self.x
 
-    def draw(self, surface):
-        pygame.draw.rect(surface, BLUE, self.rect)
-
-class Ball:
-    def __init__(self):
-        self.radius = BALL_RADIUS
-        # Start ball just above the paddle, centered
-        self.x = SCREEN_WIDTH // 2
-        self.y = SCREEN_HEIGHT - 40 - int(self.radius * 5)  # a bit higher above the paddle
-        self.dx = 0
-        self.dy = BALL_SPEED  # move downwards towards the paddle
-        self.prev_x = self.x
-        self.prev_y = self.y
-
+    # Draw at alpha (0 to 1) of the way from the previous step position to the current one
+    def draw(self, surface, alpha=1.0):
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        pygame.draw.rect(surface, BLUE, (x, self.y, self.width, self.height))
+
+# Every ball in play as a structure of arrays (one NumPy array per coordinate), so moving,
+# bouncing and looking up bricks is done for all balls at once instead of ball by ball.
+# Only the first count entries of the arrays are balls in play
+class BallPool:
+    def __init__(self, capacity=MAX_BALLS, radius=BALL_RADIUS):
+        self.capacity = capacity
+        self.radius = radius
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.dx = np.zeros(capacity)
+        self.dy = np.zeros(capacity)
+        self.prev_x = np.zeros(capacity)
+        self.prev_y = np.zeros(capacity)
+        self.sprite = None
+
+    def __len__(self):
+        return self.count
+
+    # Add a ball (ignored when the pool is full)
+    def add(self, x, y, dx, dy):
+        if self.count < self.capacity:
+            i = self.count
+            self.x[i] = self.prev_x[i] = x
+            self.y[i] = self.prev_y[i] = y
+            self.dx[i] = dx
+            self.dy[i] = dy
+            self.count += 1
+
+    # New ball just above the paddle, centered, moving down towards it
+    def serve(self):
+        self.add(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40 - int(self.radius * 5), 0, BALL_SPEED)
+
+    def clear(self):
+        self.count = 0
+
+    # Stop every ball where it is: the previous step position becomes the current one, so drawing
+    # between steps doesn't keep moving it
+    def hold(self):
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    # Move every ball one step and bounce it off the side and top walls.
+    # Return True when any ball bounced
     def move(self):
-        self.prev_x = self.x
-        self.prev_y = self.y
-        self.x += self.dx
-        self.y += self.dy
+        n = self.count
+        x, y, dx, dy = self.x[:n], self.y[:n], self.dx[:n], self.dy[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += dx
+        y += dy
 
         # Wall collision
-        if self.x <= self.radius:
-            self.x = self.radius
-            self.dx *= -1
-            play_sound(BOUNCE_SOUND)
-        elif self.x >= SCREEN_WIDTH - self.radius:
-            self.x = SCREEN_WIDTH - self.radius
-            self.dx *= -1
-            play_sound(BOUNCE_SOUND)
-        if self.y <= self.radius:
-            self.y = self.radius
-            self.dy *= -1
-            play_sound(BOUNCE_SOUND)
-
-    def draw(self, surface):
-        pygame.draw.circle(surface, WHITE, (self.x, self.y), self.radius)
-
-    def rect(self):
-        return pygame.Rect(self.x - self.radius, self.y - self.radius, self.radius*2, self.radius*2)
+        r = self.radius
+        left = x <= r
+        right = x >= SCREEN_WIDTH - r
+        top = y <= r
+        x[left] = r
+        x[right] = SCREEN_WIDTH - r
+        dx[left | right] *= -1
+        y[top] = r
+        dy[top] *= -1
+        return bool(left.any() or right.any() or top.any())
+
+    # Top-left corner of the square around every ball, truncated like a pygame.Rect
+    def rect_corners(self):
+        n = self.count
+        return np.trunc(self.x[:n] - self.radius).astype(int), np.trunc(self.y[:n] - self.radius).astype(int)
+
+    # Bounce the balls touching the paddle with an angle that depends on where they hit it.
+    # Return True when any ball bounced
+    def bounce_paddle(self, paddle):
+        left, top = self.rect_corners()
+        size = self.radius * 2
+        rect = paddle.rect
+        hit = (left < rect.right) & (rect.left < left + size) & (top < rect.bottom) & (rect.top < top + size)
+        if not hit.any():
+            return False
+
+        hit = np.flatnonzero(hit)
+        # Where the balls hit the paddle: 0 (left) to 1 (right)
+        hit_pos = (self.x[hit] - paddle.x) / paddle.width
+        # Angle varies from 150° (left) to 30° (right)
+        min_angle = 150
+        max_angle = 30
+        angle_rad = np.radians(min_angle + (max_angle - min_angle) * hit_pos)
+        speed = np.hypot(self.dx[hit], self.dy[hit])
+        self.dx[hit] = speed * np.cos(angle_rad)
+        self.dy[hit] = -np.abs(speed * np.sin(angle_rad))
+        self.y[hit] = rect.y - self.radius
+        return True
+
+    # Indices of the balls touching a live brick and the grid cell of the first brick each touches
+    def brick_hits(self, bricks):
+        left, top = self.rect_corners()
+        return bricks.first_hits(left, top, self.radius * 2)
+
+    # Remove the balls that fell below the screen, return how many are left
+    def remove_fallen(self):
+        n = self.count
+        keep = self.y[:n] <= SCREEN_HEIGHT
+        kept = int(keep.sum())
+        if kept < n:
+            for values in (self.x, self.y, self.dx, self.dy, self.prev_x, self.prev_y):
+                values[:kept] = values[:n][keep]
+            self.count = kept
+        return kept
+
+    # Split every ball into three: itself and two copies turned by +-SPLIT_ANGLE
+    def split(self):
+        n = self.count
+        for angle in (SPLIT_ANGLE, -SPLIT_ANGLE):
+            copies = min(n, self.capacity - self.count)
+            if copies <= 0:
+                break
+            new = slice(self.count, self.count + copies)
+            cos, sin = math.cos(angle), math.sin(angle)
+            dx, dy = self.dx[:copies], self.dy[:copies]
+            self.dx[new] = dx * cos - dy * sin
+            self.dy[new] = dx * sin + dy * cos
+            for values in (self.x, self.y, self.prev_x, self.prev_y):
+                values[new] = values[:copies]
+            self.count += copies
+
+    # Draw every ball at alpha (0 to 1) of the way from the previous step position to the current
+    # one: the ball sprite is drawn once and all balls go to the screen in a single blits call
+    def draw(self, surface, alpha=1.0):
+        if self.sprite is None:
+            size = self.radius * 2
+            self.sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(self.sprite, WHITE, (self.radius, self.radius), self.radius)
+            if pygame.display.get_surface() is not None:
+                self.sprite = self.sprite.convert_alpha()
+
+        n = self.count
+        xs = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha - self.radius
+        ys = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha - self.radius
+        sprite = self.sprite
+        surface.blits([(sprite, position) for position in zip(xs.tolist(), ys.tolist())], False)
 
 class Brick:
-    def __init__(self, x, y, color):
-        self.rect = pygame.Rect(x, y, BRICK_WIDTH - BRICK_PADDING, BRICK_HEIGHT - BRICK_PADDING)
+    def __init__(self, x, y, color, width=BRICK_WIDTH - BRICK_PADDING, height=BRICK_HEIGHT - BRICK_PADDING,
+                 points=None, hits=1):
+        self.rect = pygame.Rect(x, y, width, height)
         self.color = color
+        self.points = COLOR_POINTS.get(color, 1) if points is None else points
+        self.hits = hits
         self.alive = True
+        self.cell = None
 
-    def draw(self, surface):
+    # Draw the brick with its top shifted up by top pixels (used to paint it into a layer
+    # surface that starts at the top of the brick area)
+    def draw(self, surface, top=0):
         if self.alive:
-            pygame.draw.rect(surface, self.color, self.rect)
-            pygame.draw.rect(surface, WHITE, self.rect, 2)
-
-def create_bricks():
-    bricks = []
-    for row in range(8):
-        color = ORGANIZED_COLORS[row]
-        for col in range(BRICK_COLS):
-            x = col * BRICK_WIDTH + BRICK_PADDING // 2
-            y = row * BRICK_HEIGHT + TOP_OFFSET
-            bricks.append(Brick(x, y, color))
+            rect = self.rect.move(0, -top)
+            pygame.draw.rect(surface, self.color, rect)
+            # Bricks that take more than one more hit get a thicker border
+            pygame.draw.rect(surface, WHITE, rect, 2 if self.hits <= 1 else 4)
+
+# Bricks stored in a uniform grid with one cell per brick position, so a ball only
+# looks at the cells under it (at most four) instead of every brick in the level.
+# Live, per-color and score counters are kept up to date on every add/destroy, so
+# win checks and speed-up triggers never have to walk the bricks.
+# The wall is painted once into an off-screen layer: destroying a brick only clears its
+# own rect in the layer, and drawing the field is a single blit per frame.
+# A NumPy copy of which cells hold a live brick lets first_hits test many balls at once.
+class BrickField:
+    def __init__(self, cols, rows, cell_width=BRICK_WIDTH, cell_height=BRICK_HEIGHT, top=TOP_OFFSET):
+        self.cols = cols
+        self.rows = rows
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.top = top
+        self.padding = min(BRICK_PADDING, cell_width // 4, cell_height // 4)
+        self.cells = [None] * (cols * rows)
+        self.live_cells = np.zeros(cols * rows, dtype=bool)
+        self.bricks = []
+        self.alive_count = 0
+        self.destroyed_count = 0
+        self.color_counts = {}
+        self.points_left = 0
+        self.points_scored = 0
+        self.layer = None
+
+    def __iter__(self):
+        return iter(self.bricks)
+
+    def __len__(self):
+        return len(self.bricks)
+
+    def add(self, col, row, color, points=None, hits=1):
+        x = col * self.cell_width + self.padding // 2
+        y = row * self.cell_height + self.top
+        brick = Brick(x, y, color, self.cell_width - self.padding, self.cell_height - self.padding, points, hits)
+        brick.cell = row * self.cols + col
+        self.cells[brick.cell] = brick
+        self.live_cells[brick.cell] = True
+        self.bricks.append(brick)
+        self.alive_count += 1
+        self.color_counts[color] = self.color_counts.get(color, 0) + 1
+        self.points_left += brick.points
+        if self.layer is not None:
+            brick.draw(self.layer, self.top)
+        return brick
+
+    # Brick collision test for many squares at once, looking only at the cells each square covers:
+    # left and top are arrays with the corners of the squares, size their side. Return the indices
+    # of the squares that touch a live brick and, for each of them, the cell of the first brick it
+    # touches in row order
+    def first_hits(self, left, top, size):
+        # Only the squares that reach the rows of the wall can touch a brick
+        inside = np.flatnonzero((top + size > self.top) & (top < self.top + self.rows * self.cell_height))
+        if len(inside) == 0:
+            return inside, inside
+        left = left[inside]
+        top = top[inside]
+
+        first_col = np.maximum(left // self.cell_width, 0)
+        last_col = np.minimum((left + size - 1) // self.cell_width, self.cols - 1)
+        first_row = np.maximum((top - self.top) // self.cell_height, 0)
+        last_row = np.minimum((top + size - 1 - self.top) // self.cell_height, self.rows - 1)
+        row_span = int((last_row - first_row).max()) + 1
+        col_span = int((last_col - first_col).max()) + 1
+
+        hits = np.full(len(inside), -1)
+        brick_width = self.cell_width - self.padding
+        brick_height = self.cell_height - self.padding
+        for row_offset in range(row_span):
+            row = first_row + row_offset
+            for col_offset in range(col_span):
+                col = first_col + col_offset
+                test = (hits < 0) & (row <= last_row) & (col <= last_col)
+                cell = np.where(test, row * self.cols + col, 0)
+                test &= self.live_cells[cell]
+                # Brick rect of the cell, as built by add
+                brick_left = col * self.cell_width + self.padding // 2
+                brick_top = row * self.cell_height + self.top
+                test &= ((left < brick_left + brick_width) & (brick_left < left + size)
+                         & (top < brick_top + brick_height) & (brick_top < top + size))
+                hits[test] = cell[test]
+
+        found = hits >= 0
+        return inside[found], hits[found]
+
+    # Take one hit point from a live brick, destroying it when none are left.
+    # Return the points scored (0 while the brick is still standing)
+    def hit(self, brick):
+        brick.hits -= 1
+        if brick.hits > 0:
+            if self.layer is not None:
+                brick.draw(self.layer, self.top)
+            return 0
+        return self.destroy(brick)
+
+    # Destroy a live brick and return the points it is worth
+    def destroy(self, brick):
+        brick.alive = False
+        self.cells[brick.cell] = None
+        self.live_cells[brick.cell] = False
+        points = brick.points
+        self.alive_count -= 1
+        self.destroyed_count += 1
+        self.color_counts[brick.color] -= 1
+        self.points_left -= points
+        self.points_scored += points
+        if self.layer is not None:
+            self.layer.fill(BLACK, brick.rect.move(0, -self.top))
+        return points
+
+    def cleared(self):
+        return self.alive_count == 0
+
+    # Paint every live brick into a new layer surface
+    def build_layer(self):
+        self.layer = pygame.Surface((self.cols * self.cell_width, self.rows * self.cell_height))
+        if pygame.display.get_surface() is not None:
+            self.layer = self.layer.convert()
+        self.layer.fill(BLACK)
+        for brick in self.bricks:
+            brick.draw(self.layer, self.top)
+
+    def draw(self, surface):
+        if self.layer is None:
+            self.build_layer()
+        surface.blit(self.layer, (0, self.top))
+
+# Build the wall of a level, or the classic 8x8 wall when there is no level
+def create_bricks(level=None):
+    if level is None:
+        bricks = BrickField(BRICK_COLS, len(ORGANIZED_COLORS))
+        for row in range(len(ORGANIZED_COLORS)):
+            color = ORGANIZED_COLORS[row]
+            for col in range(BRICK_COLS):
+                bricks.add(col, row, color)
+        return bricks
+
+    if level.cols > SCREEN_WIDTH or level.rows > BRICK_AREA_HEIGHT:
+        raise ValueError(f"level {level.name} is too big: at most {SCREEN_WIDTH}x{BRICK_AREA_HEIGHT} bricks")
+    cell_width = SCREEN_WIDTH // level.cols
+    cell_height = max(min(BRICK_HEIGHT, BRICK_AREA_HEIGHT // level.rows), 1)
+    bricks = BrickField(level.cols, level.rows, cell_width, cell_height)
+    for col, row, brick_type in level.bricks:
+        bricks.add(col, row, brick_type.color, brick_type.points, brick_type.hits)
     return bricks
 
-def main():
-    running = True
-    paddle = Paddle()
-    ball = Ball()
-    bricks = create_bricks()
-    score = 0
-    lives = 0 
-    font = pygame.font.SysFont("Arial", 28)
-    game_over = False
-    win = False
+# Whole game state: update advances it by one fixed step, render draws it.
+# With a LevelPack the levels are played in order, otherwise only the classic wall
+class Game:
+    def __init__(self, levels=None, rng=None):
+        self.levels = levels
+        self.rng = rng or random.Random()
+        self.paddle = Paddle()
+        self.balls = BallPool()
+        self.capsules = []
+        self.restart()
+
+    def restart(self):
+        self.score = 0
+        self.lives = 0
+        self.game_over = False
+        self.win = False
+        self.start_level(0)
+
+    def start_level(self, index):
+        self.level_index = index
+        self.balls.clear()
+        self.balls.serve()
+        self.capsules.clear()
+        self.bricks = create_bricks(self.levels.get(index) if self.levels else None)
+
+    # Advance the game by one STEP_TIME step with the keys held during it
+    # (inputs is one step of an input recording)
+    def update_inputs(self, inputs):
+        self.update(inputs & INPUT_LEFT, inputs & INPUT_RIGHT, inputs & INPUT_RESTART)
+
+    def update(self, left, right, restart):
+        paddle = self.paddle
+        paddle.prev_x = paddle.x
+        if left:
+            paddle.move("LEFT")
+        if right:
+            paddle.move("RIGHT")
 
-    while running:
-        screen.fill(BLACK)
+        # The simulation is stopped: the balls stay put instead of being drawn between their last two steps
+        if self.game_over:
+            self.balls.hold()
+            if restart:
+                self.restart()
+            return
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
+        balls = self.balls
+        if balls.move():
+            play_sound(BOUNCE_SOUND)
 
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            paddle.move("LEFT")
-        if keys[pygame.K_RIGHT]:
-            paddle.move("RIGHT")
+        # Ball and paddle collision
+        if balls.bounce_paddle(paddle):
+            play_sound(BOUNCE_SOUND)
 
-        if not game_over:
-            ball.move()
-
-            # Ball and paddle collision
-            if ball.rect().colliderect(paddle.rect):
-                # Calculate where the ball hit the paddle
-                hit_pos = (ball.x - paddle.x) / paddle.width  # 0 (left) to 1 (right)
-                # Angle varies from 150° (left) to 30° (right)
-                min_angle = 150
-                max_angle = 30
-                angle_deg = min_angle + (max_angle - min_angle) * hit_pos
-                angle_rad = math.radians(angle_deg)
-                speed = math.hypot(ball.dx, ball.dy)
-                ball.dx = speed * math.cos(angle_rad)
-                ball.dy = -abs(speed * math.sin(angle_rad))
-                ball.y = paddle.rect.y - ball.radius
-                play_sound(BOUNCE_SOUND)
-
-            # Ball and brick collision
-            for brick in bricks:
-                if brick.alive and ball.rect().colliderect(brick.rect):
-                    brick.alive = False
-                    # Score by color
-                    brick_points = COLOR_POINTS.get(brick.color, 1)
-                    score += brick_points
-                    play_sound(BRICK_SOUND)
-                    # Increase ball speed every 20 bricks destroyed
-                    destroyed_bricks = sum(not b.alive for b in bricks)
-                    if destroyed_bricks % 20 == 0 and destroyed_bricks > 0:
-                        ball.dx *= 1.1
-                        ball.dy *= 1.1
-                    # Improved collision response using previous ball position
-                    prev_rect = pygame.Rect(ball.prev_x - ball.radius, ball.prev_y - ball.radius, ball.radius*2, ball.radius*2)
-                    brick_rect = brick.rect
-                    if prev_rect.right <= brick_rect.left:
-                        ball.dx = -abs(ball.dx)  # hit left, go left
-                    elif prev_rect.left >= brick_rect.right:
-                        ball.dx = abs(ball.dx)   # hit right, go right
-                    elif prev_rect.bottom <= brick_rect.top:
-                        ball.dy = -abs(ball.dy)  # hit top, go up
-                    elif prev_rect.top >= brick_rect.bottom:
-                        ball.dy = abs(ball.dy)   # hit bottom, go down
-                    else:
-                        ball.dy *= -1  # fallback: invert vertical
-                    break
-
-            # Ball falls below screen
-            if ball.y > SCREEN_HEIGHT:
-                if lives < 3:
-                    lives += 1
-                    ball = Ball()
-                    paddle = Paddle()
-                elif lives == 3:
-                    game_over = True
-                    win = False
-                    play_sound(GAMEOVER_SOUND)
-
-        # Draw all game objects
-        paddle.draw(screen)
-        ball.draw(screen)
-        for brick in bricks:
-            brick.draw(screen)
+        # Ball and brick collision (only the bricks in the grid cells under each ball)
+        bricks = self.bricks
+        hit_balls, hit_cells = balls.brick_hits(bricks)
+        radius = balls.radius
+        for i, cell in zip(hit_balls.tolist(), hit_cells.tolist()):
+            brick = bricks.cells[cell]
+            if brick is None:
+                continue  # destroyed by another ball in this step
+            # Score by brick type (nothing until the last hit point is gone)
+            self.score += bricks.hit(brick)
+            play_sound(BRICK_SOUND)
+            # Bricks can be worth 0 points, so destroyed is told by alive, not by the score
+            if not brick.alive:
+                # Increase ball speed every 20 bricks destroyed
+                if bricks.destroyed_count % 20 == 0:
+                    balls.dx[i] *= 1.1
+                    balls.dy[i] *= 1.1
+                # Destroyed bricks sometimes drop a multi-ball capsule
+                if self.rng.random() < MULTIBALL_CHANCE:
+                    self.capsules.append(pygame.Rect(brick.rect.centerx - CAPSULE_WIDTH // 2, brick.rect.centery,
+                                                     CAPSULE_WIDTH, CAPSULE_HEIGHT))
+            # Improved collision response using previous ball position
+            prev_left = int(balls.prev_x[i] - radius)
+            prev_top = int(balls.prev_y[i] - radius)
+            brick_rect = brick.rect
+            if prev_left + radius * 2 <= brick_rect.left:
+                balls.dx[i] = -abs(balls.dx[i])  # hit left, go left
+            elif prev_left >= brick_rect.right:
+                balls.dx[i] = abs(balls.dx[i])   # hit right, go right
+            elif prev_top + radius * 2 <= brick_rect.top:
+                balls.dy[i] = -abs(balls.dy[i])  # hit top, go up
+            elif prev_top >= brick_rect.bottom:
+                balls.dy[i] = abs(balls.dy[i])   # hit bottom, go down
+            else:
+                balls.dy[i] *= -1  # fallback: invert vertical
+
+        # Falling capsules: caught by the paddle they split every ball in three
+        for capsule in self.capsules[:]:
+            capsule.y += CAPSULE_SPEED
+            if capsule.colliderect(paddle.rect):
+                self.capsules.remove(capsule)
+                balls.split()
+            elif capsule.top > SCREEN_HEIGHT:
+                self.capsules.remove(capsule)
+
+        # Next level, or win after the last one
+        if bricks.cleared():
+            play_sound(WIN_SOUND)
+            if self.levels and self.level_index + 1 < len(self.levels):
+                self.start_level(self.level_index + 1)
+            else:
+                self.game_over = True
+                self.win = True
+            return
+
+        # Balls fall below screen, a life is lost when none is left
+        if balls.remove_fallen() == 0:
+            if self.lives < 3:
+                self.lives += 1
+                balls.serve()
+                self.capsules.clear()
+                self.paddle = Paddle()
+            else:
+                self.game_over = True
+                self.win = False
+                play_sound(GAMEOVER_SOUND)
+
+    # Draw the game, moving objects alpha (0 to 1) of the way from the previous step to the current one
+    def render(self, surface, font, alpha=1.0):
+        surface.fill(BLACK)
+
+        # Draw all game objects (the brick layer is opaque, so it goes first)
+        self.bricks.draw(surface)
+        for capsule in self.capsules:
+            pygame.draw.rect(surface, CAPSULE_COLOR, capsule, border_radius=CAPSULE_HEIGHT // 2)
+        self.paddle.draw(surface, alpha)
+        self.balls.draw(surface, alpha)
 
         # Draw score and life meter
-        score_text = font.render(f"Score: {score}", True, WHITE)
-        screen.blit(score_text, (10, 10))
-        life_text = font.render(f"Life Meter: {lives}/3", True, WHITE)
-        screen.blit(life_text, (SCREEN_WIDTH - 180, 10))
+        score_text = render_text(font, f"Score: {self.score}", True, WHITE)
+        surface.blit(score_text, (10, 10))
+        life_text = render_text(font, f"Life Meter: {self.lives}/3", True, WHITE)
+        surface.blit(life_text, (SCREEN_WIDTH - 180, 10))
+        if self.levels:
+            level_text = render_text(font, f"Level {self.level_index + 1}", True, WHITE)
+            surface.blit(level_text, (SCREEN_WIDTH//2 - level_text.get_width()//2, 10))
 
         # Win or lose
-        if all(not brick.alive for brick in bricks):
-            win_text = font.render("You Win! Press R to Restart", True, GREEN)
-            screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
-            if not game_over:
-                play_sound(WIN_SOUND)
-            game_over = True
-            win = True
-
-        if game_over and not win and lives >= 3:
-            lose_text = font.render("Game Over! Press R to Restart", True, RED)
-            screen.blit(lose_text, (SCREEN_WIDTH//2 - lose_text.get_width()//2, SCREEN_HEIGHT//2))
-
-        if game_over:
-            if keys[pygame.K_r]:
-                ball = Ball()
-                bricks = create_bricks()
-                score = 0
-                lives = 0  # Reset lives when restarting
-                game_over = False
-                win = False
+        if self.game_over:
+            if self.win:
+                message_text = render_text(font, "You Win! Press R to Restart", True, GREEN)
+            else:
+                message_text = render_text(font, "Game Over! Press R to Restart", True, RED)
+            surface.blit(message_text, (SCREEN_WIDTH//2 - message_text.get_width()//2, SCREEN_HEIGHT//2))
+
+# Average simulation and render time per frame, shown in the window title once per STATS_INTERVAL
+class FrameStats:
+    def __init__(self):
+        self.frame_count = 0
+        self.step_count = 0
+        self.sim_time = 0.0
+        self.render_time = 0.0
+        self.report_time = time.perf_counter()
+
+    def count_frame(self, steps, sim_time, render_time):
+        self.frame_count += 1
+        self.step_count += steps
+        self.sim_time += sim_time
+        self.render_time += render_time
+
+        now = time.perf_counter()
+        elapsed = now - self.report_time
+        if elapsed >= STATS_INTERVAL:
+            pygame.display.set_caption(
+                f"Breakout Game with Sound - sim {self.sim_time / self.frame_count * 1000:.2f} ms, "
+                f"render {self.render_time / self.frame_count * 1000:.2f} ms per frame, "
+                f"{self.frame_count / elapsed:.0f} fps, {self.step_count / elapsed:.0f} steps/s")
+            self.frame_count = 0
+            self.step_count = 0
+            self.sim_time = 0.0
+            self.render_time = 0.0
+            self.report_time = now
+
+# Play the game in a window. With a recording (a bytearray), the keys held in every
+# simulation step are appended to it, to be replayed with Game.update_inputs
+def main(levels=None, recording=None):
+    game = Game(levels)
+    font = pygame.font.SysFont("Arial", 28)
+    stats = FrameStats()
+    accumulator = 0.0
+    last_time = time.perf_counter()
+    running = True
 
-        pygame.display.flip()
-        clock.tick(FPS)
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
 
-        # Win or lose
-        if all(not brick.alive for brick in bricks):
-            win_text = font.render("You Win! Press R to Restart", True, GREEN)
-            screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
-            if not game_over:
-                play_sound(WIN_SOUND)
-            game_over = True
-            win = True
-
-        if game_over:
-            if keys[pygame.K_r]:
-                ball = Ball()
-                bricks = create_bricks()
-                score = 0
-                game_over = False
-                win = False
+        keys = pygame.key.get_pressed()
 
+        # Run as many fixed steps as the real time elapsed since the last frame
+        now = time.perf_counter()
+        accumulator = min(accumulator + now - last_time, MAX_FRAME_TIME)
+        last_time = now
+        steps = 0
+        while accumulator >= STEP_TIME:
+            accumulator -= STEP_TIME
+            inputs = ((keys[pygame.K_LEFT] and INPUT_LEFT) | (keys[pygame.K_RIGHT] and INPUT_RIGHT)
+                      | (keys[pygame.K_r] and INPUT_RESTART))
+            game.update_inputs(inputs)
+            if recording is not None:
+                recording.append(inputs)
+            steps += 1
+
+        # Render once, between the last two steps
+        render_start = time.perf_counter()
+        game.render(screen, font, accumulator / STEP_TIME)
         pygame.display.flip()
+        stats.count_frame(steps, render_start - now, time.perf_counter() - render_start)
+
         clock.tick(FPS)
 
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Breakout")
+    parser.add_argument("--levels", default=LEVELS_PATH,
+                        help="folder with the level files (the classic wall is played when it has none)")
+    parser.add_argument("--generate", metavar="COLSxROWS", default=None,
+                        help="play generated levels of this size instead of the level files")
+    parser.add_argument("--density", type=float, default=0.8, help="chance of a brick in each cell of a generated level")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first generated level")
+    parser.add_argument("--record", default=None, help="save the keys of every simulation step to this file")
+    args = parser.parse_args()
+
+    if args.generate:
+        cols, rows = (int(value) for value in args.generate.lower().split("x"))
+        levels = GeneratedPack(cols, rows, args.density, args.seed, count=10)
+    else:
+        levels = LevelPack.from_folder(args.levels) if os.path.isdir(args.levels) else None
+    recording = bytearray() if args.record else None
+    try:
+        main(levels if levels else None, recording)
+    finally:
+        if levels:
+            levels.close()
+        if recording is not None:
+            with open(args.record, "wb") as record_file:
+                record_file.write(recording)
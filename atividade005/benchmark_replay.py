@@ -0,0 +1,88 @@
+# Replay benchmark: Breakout frame times on generated walls of growing size
+#
+#   Replays the same input recording (one byte of held keys per simulation step, saved by
+#   Breakout.py --record, or a seeded random one) on generated levels of every size, one update and
+#   one render per step, and reports the p50/p95/p99 of the update, render and whole frame times.
+#   Runs without a window or sound (SDL dummy drivers), same seed and recording give the same game.
+#
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+
+import Breakout
+from levels import GeneratedPack
+
+PERCENTILES = (50, 95, 99)
+
+
+# Random recording: the paddle holds left, right or nothing for a while, R is always held so a
+# lost game restarts right away
+def make_recording(steps, seed):
+    rng = random.Random(seed)
+    recording = bytearray()
+    while len(recording) < steps:
+        keys = rng.choice((0, Breakout.INPUT_LEFT, Breakout.INPUT_RIGHT)) | Breakout.INPUT_RESTART
+        recording.extend([keys] * rng.randint(5, 40))
+    return recording[:steps]
+
+
+# Play the recording on one generated level size, return the update and render time of every step
+# in milliseconds
+def replay(recording, cols, rows, density, seed, splits, font):
+    game = Breakout.Game(GeneratedPack(cols, rows, density, seed), random.Random(seed))
+    for _ in range(splits):
+        game.balls.split()
+    screen = Breakout.screen
+
+    update_times = np.zeros(len(recording))
+    render_times = np.zeros(len(recording))
+    for step, inputs in enumerate(recording):
+        start_time = time.perf_counter()
+        game.update_inputs(inputs)
+        render_start = time.perf_counter()
+        game.render(screen, font)
+        pygame.display.flip()
+        end_time = time.perf_counter()
+        update_times[step] = (render_start - start_time) * 1000
+        render_times[step] = (end_time - render_start) * 1000
+    return update_times, render_times, len(game.bricks)
+
+
+def format_percentiles(times):
+    return "/".join(f"{value:.3f}" for value in np.percentile(times, PERCENTILES))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Breakout replay benchmark on generated levels")
+    parser.add_argument("--sizes", default="8x8,32x16,64x48,150x100,300x300",
+                        help="comma separated COLSxROWS wall sizes")
+    parser.add_argument("--density", type=float, default=0.8, help="chance of a brick in each cell")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the levels, capsules and random recording")
+    parser.add_argument("--steps", type=int, default=3000, help="steps of the random recording")
+    parser.add_argument("--replay", default=None, help="input recording saved by Breakout.py --record")
+    parser.add_argument("--splits", type=int, default=0,
+                        help="multi-ball splits at the start (every split triples the balls)")
+    args = parser.parse_args()
+
+    if args.replay:
+        with open(args.replay, "rb") as recording_file:
+            recording = bytearray(recording_file.read())
+    else:
+        recording = make_recording(args.steps, args.seed)
+    font = pygame.font.SysFont("Arial", 28)
+
+    print(f"{len(recording)} steps, density {args.density}, seed {args.seed}, p{'/p'.join(map(str, PERCENTILES))} in ms")
+    print(f"{'size':>9} {'bricks':>7}  {'update':>20}  {'render':>20}  {'frame':>20}")
+    for size in args.sizes.split(","):
+        cols, rows = (int(value) for value in size.lower().split("x"))
+        update_times, render_times, bricks = replay(recording, cols, rows, args.density, args.seed, args.splits, font)
+        print(f"{size:>9} {bricks:>7}  {format_percentiles(update_times):>20}  {format_percentiles(render_times):>20}  "
+              f"{format_percentiles(update_times + render_times):>20}")
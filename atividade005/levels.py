@@ -0,0 +1,174 @@
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+# Breakout level files (levels/*.txt), one level per file:
+#
+#   name Classic              level name (optional, defaults to the file name)
+#   brick S 160 160 160 10 2  brick type: grid character, color (r g b), points, hit points
+#   grid                      every line after this one is a row of the wall
+#   RRRRRRRR                  one character per brick ("." or a space is an empty cell)
+#
+#   Lines starting with "#" and blank lines are ignored before the grid. The types in
+#   DEFAULT_BRICK_TYPES can be used without being declared, a "brick" line replaces them.
+#   Rows shorter than the widest one are padded with empty cells.
+
+
+# One kind of brick: how it looks, what it is worth and how many hits it takes
+@dataclass(frozen=True)
+class BrickType:
+    color: tuple
+    points: int
+    hits: int = 1
+
+
+DEFAULT_BRICK_TYPES = {
+    "R": BrickType((219, 68, 55), 8),
+    "O": BrickType((255, 140, 0), 5),
+    "G": BrickType((15, 157, 88), 3),
+    "Y": BrickType((244, 180, 0), 1),
+    "S": BrickType((160, 160, 160), 10, 2),
+}
+
+EMPTY_CELLS = ". "
+
+# Generated levels: brick types from the top row band to the bottom one, and the chance of a
+# steel brick in any cell
+GENERATED_BANDS = "RROOGGYY"
+GENERATED_STEEL_CHANCE = 0.05
+
+
+# A parsed level: the wall size and its bricks as (col, row, brick type)
+@dataclass
+class Level:
+    name: str
+    cols: int
+    rows: int
+    bricks: list
+
+
+class LevelError(ValueError):
+    pass
+
+
+# Parse the text of a level file
+def parse_level(text, name="level"):
+    brick_types = dict(DEFAULT_BRICK_TYPES)
+    lines = text.splitlines()
+
+    for line_number, line in enumerate(lines, 1):
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        if fields[0] == "name":
+            name = line.split(None, 1)[1].strip() if len(fields) > 1 else name
+        elif fields[0] == "brick":
+            if len(fields) not in (6, 7) or len(fields[1]) != 1 or fields[1] in EMPTY_CELLS:
+                raise LevelError(f"{name}:{line_number}: expected 'brick CHAR R G B POINTS [HITS]'")
+            try:
+                values = [int(value) for value in fields[2:]]
+            except ValueError:
+                raise LevelError(f"{name}:{line_number}: brick color, points and hits must be integers")
+            if not all(0 <= value <= 255 for value in values[:3]):
+                raise LevelError(f"{name}:{line_number}: brick color components must be from 0 to 255")
+            if len(values) == 5 and values[4] < 1:
+                raise LevelError(f"{name}:{line_number}: brick hits must be at least 1")
+            brick_types[fields[1]] = BrickType(tuple(values[:3]), *values[3:])
+        elif fields[0] == "grid":
+            grid = lines[line_number:]
+            break
+        else:
+            raise LevelError(f"{name}:{line_number}: unknown line '{fields[0]}'")
+    else:
+        raise LevelError(f"{name}: missing 'grid' line")
+
+    # Trailing blank lines are not rows
+    while grid and not grid[-1].strip():
+        grid.pop()
+    if not grid:
+        raise LevelError(f"{name}: empty grid")
+
+    bricks = []
+    for row, cells in enumerate(grid):
+        for col, cell in enumerate(cells):
+            if cell in EMPTY_CELLS:
+                continue
+            if cell not in brick_types:
+                raise LevelError(f"{name}: unknown brick type '{cell}' at row {row + 1}, column {col + 1}")
+            bricks.append((col, row, brick_types[cell]))
+
+    return Level(name, max(len(cells) for cells in grid), len(grid), bricks)
+
+
+# Random wall of cols x rows cells where each cell has a brick with chance density. The same
+# arguments always give the same level
+def generate_level(cols, rows, density=1.0, seed=0):
+    rng = random.Random(seed)
+    bricks = []
+    for row in range(rows):
+        band = GENERATED_BANDS[row * len(GENERATED_BANDS) // rows]
+        for col in range(cols):
+            if rng.random() < density:
+                cell = "S" if rng.random() < GENERATED_STEEL_CHANCE else band
+                bricks.append((col, row, DEFAULT_BRICK_TYPES[cell]))
+    return Level(f"generated {cols}x{rows} #{seed}", cols, rows, bricks)
+
+
+def load_level(path):
+    with open(path, encoding="utf-8") as level_file:
+        return parse_level(level_file.read(), os.path.splitext(os.path.basename(path))[0])
+
+
+# Ordered level files that are only read when needed: getting a level starts parsing the
+# next one on a background thread, so it is ready by the time the current one is cleared
+class LevelPack:
+    def __init__(self, paths):
+        self.paths = list(paths)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pending = {}
+
+    # Every .txt file in folder, in file name order
+    @classmethod
+    def from_folder(cls, folder):
+        names = sorted(name for name in os.listdir(folder) if name.endswith(".txt"))
+        return cls(os.path.join(folder, name) for name in names)
+
+    def __len__(self):
+        return len(self.paths)
+
+    # Start parsing a level in the background (does nothing if it is already queued)
+    def prefetch(self, index):
+        if 0 <= index < len(self.paths) and index not in self.pending:
+            self.pending[index] = self.executor.submit(load_level, self.paths[index])
+
+    # Return a level, waiting only if its background parse has not finished yet
+    def get(self, index):
+        self.prefetch(index)
+        level = self.pending.pop(index).result()
+        for queued in [queued for queued in self.pending if queued != index + 1]:
+            self.pending.pop(queued).cancel()
+        self.prefetch(index + 1)
+        return level
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Generated levels with the same interface as LevelPack: level index i uses seed + i
+class GeneratedPack:
+    def __init__(self, cols, rows, density=1.0, seed=0, count=1):
+        self.cols = cols
+        self.rows = rows
+        self.density = density
+        self.seed = seed
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def get(self, index):
+        return generate_level(self.cols, self.rows, self.density, self.seed + index)
+
+    def close(self):
+        pass
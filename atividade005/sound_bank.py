@@ -0,0 +1,94 @@
+import os
+import time
+
+import numpy as np
+import pygame
+
+# Sample types for the mixer sample sizes reported by pygame.mixer.get_init() (negative sizes are
+# signed, -32 is a float mixer: pygame has no 32-bit integer format)
+SAMPLE_TYPES = {8: np.uint8, -8: np.int8, 16: np.uint16, -16: np.int16, -32: np.float32}
+
+
+# Sound effects decoded once at startup and played on a fixed pool of mixer channels
+#   Files are looked up in a list of folders when they are loaded, a sound whose file is missing or
+#   can't be decoded gets a synthesized beep instead. play never waits: it takes the next channel of
+#   the pool (cutting whatever was still playing on it) and skips a sound that already started less
+#   than min_interval seconds ago, so a burst of hits in one frame plays it only once.
+#   Without an audio device the bank is silent.
+class SoundBank:
+    def __init__(self, folders, channels=8, min_interval=0.03):
+        self.folders = [folder for folder in folders if os.path.isdir(folder)]
+        self.min_interval = min_interval
+        self.sounds = {}
+        self.last_played = {}
+        self.channels = []
+        self.next_channel = 0
+
+        if pygame.mixer.get_init() is None:
+            try:
+                pygame.mixer.init()
+            except pygame.error:
+                return
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), channels))
+        pygame.mixer.set_reserved(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+
+    # First folder that has file_name, or None
+    def resolve(self, file_name):
+        for folder in self.folders:
+            path = os.path.join(folder, file_name)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    # Decode a sound file as name, or synthesize beep (start frequency, end frequency, seconds)
+    # when the file is missing or broken
+    def load(self, name, file_name, beep):
+        if not self.channels:
+            return
+        path = self.resolve(file_name)
+        if path is not None:
+            try:
+                self.sounds[name] = pygame.mixer.Sound(path)
+                return
+            except pygame.error:
+                pass
+        self.sounds[name] = synthesize_beep(*beep)
+
+    def play(self, name):
+        sound = self.sounds.get(name)
+        if sound is None:
+            return
+        now = time.perf_counter()
+        if now - self.last_played.get(name, -self.min_interval) < self.min_interval:
+            return
+        self.last_played[name] = now
+        self.channels[self.next_channel].play(sound)
+        self.next_channel = (self.next_channel + 1) % len(self.channels)
+
+
+# Square-ish beep sliding from start_frequency to end_frequency, with a short fade in and out
+# so it doesn't click. Built in the mixer's own sample format
+def synthesize_beep(start_frequency, end_frequency, duration, volume=0.3):
+    rate, size, channels = pygame.mixer.get_init()
+    samples = max(int(rate * duration), 1)
+    frequency = np.linspace(start_frequency, end_frequency, samples)
+    phase = 2 * np.pi * np.cumsum(frequency) / rate
+    wave = np.tanh(4 * np.sin(phase)) * volume
+
+    fade = min(samples // 2, int(rate * 0.005))
+    if fade:
+        ramp = np.linspace(0, 1, fade)
+        wave[:fade] *= ramp
+        wave[-fade:] *= ramp[::-1]
+
+    sample_type = SAMPLE_TYPES[size]
+    if sample_type is np.float32:
+        data = wave.astype(np.float32)
+    else:
+        info = np.iinfo(sample_type)
+        middle = (int(info.max) + int(info.min) + 1) / 2
+        data = (middle + wave * (info.max - middle)).astype(sample_type)
+    if channels > 1:
+        data = np.repeat(data[:, None], channels, axis=1)
+    return pygame.sndarray.make_sound(np.ascontiguousarray(data))
@@ -0,0 +1,45 @@
+from collections import OrderedDict
+
+# Quantity of rendered texts kept by the shared cache
+TEXT_CACHE_SIZE = 128
+
+
+# Cache of rendered text surfaces, keyed by (font, text, antialias, color, background)
+#   HUD strings change only a few times per match, so rendering them again every frame is wasted work.
+#   When the cache is full the least recently used surface is dropped.
+class TextCache:
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # Same arguments as font.render, but returns the cached surface when the text was already rendered
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, antialias, tuple(color), tuple(background) if background is not None else None)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Cache shared by the whole game
+_text_cache = TextCache()
+
+
+def render_text(font, text, antialias, color, background=None):
+    return _text_cache.render(font, text, antialias, color, background)
@@ -1,19 +1,43 @@
 import pygame
 import math
+import time
+import argparse
 
-# Window and frame rate settings
+import numpy as np
+
+# Window and frame rate settings (FPS is the default render rate)
 SCREEN_WIDTH = 768
 SCREEN_HEIGHT = 1024
 FPS = 60
 
+# The simulation always advances in steps of STEP_TIME seconds, whatever the render rate,
+# and drawing interpolates between the last two steps
+STEP_TIME = 1 / 60
+# Longest real time simulated in one frame (after a freeze or while dragging the window)
+MAX_FRAME_TIME = 0.25
+
 # Colors
 BLACK = (0, 0, 0)
 BLUE = (66, 135, 245)
+RED = (255, 0, 0)
 
 # Ship (triangle) properties
 TRI_WIDTH = 60
 TRI_HEIGHT = 40
-TRI_SPEED = 8
+TRI_SPEED = 480  # pixels per second
+TURN_SPEED = 300  # degrees per second
+
+# Small red triangle at the tip of the ship
+TIP_HEIGHT = 18
+TIP_BASE = 16
+
+# Angles are rounded to 360 / ANGLE_STEPS degrees when a ship is drawn
+ANGLE_STEPS = 360
+
+# Swarm mode: largest turn rate of a swarm ship wandering on its own (degrees per second), and
+# seconds between two frame time reports in the window title
+SWARM_TURN_RATE = 180
+SWARM_REPORT_INTERVAL = 1.0
 
 # BRAKE flag: 0 = always move forward, 1 = move only when W is pressed
 BRAKE = 0
@@ -24,6 +48,36 @@ screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Triangle Movement")
 clock = pygame.time.Clock()
 
+# Ship polygons (blue triangle and red tip) relative to the ship center, rotated once for every
+# quantised angle, with the sin/cos tables used to rotate them
+class ShipGeometry:
+	def __init__(self, width, height, steps=ANGLE_STEPS):
+		self.steps = steps
+		self.sin = [math.sin(2 * math.pi * i / steps) for i in range(steps)]
+		self.cos = [math.cos(2 * math.pi * i / steps) for i in range(steps)]
+		# Points before rotation: base left, base right and tip of both triangles
+		top = -(height // 2)
+		bottom = height - height // 2
+		body = [(-(width // 2), bottom), (width - width // 2, bottom), (0, top)]
+		tip = [(-TIP_BASE / 2, top + TIP_HEIGHT), (TIP_BASE / 2, top + TIP_HEIGHT), (0, top)]
+		self.body = [self.rotate(body, i) for i in range(steps)]
+		self.tip = [self.rotate(tip, i) for i in range(steps)]
+		# Same tables as arrays of shape (steps, 3, 2), for transforming a whole swarm at once
+		self.body_array = np.array(self.body)
+		self.tip_array = np.array(self.tip)
+
+	# Rotate points around the center by the angle of a table index
+	def rotate(self, points, index):
+		sin = self.sin[index]
+		cos = self.cos[index]
+		return [(px * cos - py * sin, px * sin + py * cos) for px, py in points]
+
+	# Table index of an angle in degrees
+	def index(self, angle):
+		return round(angle * self.steps / 360) % self.steps
+
+SHIP_GEOMETRY = ShipGeometry(TRI_WIDTH, TRI_HEIGHT)
+
 # Ship class represents the main blue triangle
 class Ship:
 	def __init__(self):
@@ -34,12 +88,19 @@ class Ship:
 		self.y = (SCREEN_HEIGHT - self.height) // 2
 		self.speed = TRI_SPEED
 		self.angle = 0  # Angle in degrees
+		self.save_state()
+
+	# Remember where the ship is at the start of a simulation step, drawing interpolates from there
+	def save_state(self):
+		self.prev_x = self.x
+		self.prev_y = self.y
+		self.prev_angle = self.angle
 
-	# Move the ship forward in the direction it is pointing
-	def move_forward(self):
+	# Move the ship forward in the direction it is pointing for dt seconds
+	def move_forward(self, dt):
 		rad = math.radians(self.angle)
-		dx = self.speed * math.sin(rad)
-		dy = -self.speed * math.cos(rad)
+		dx = self.speed * dt * math.sin(rad)
+		dy = -self.speed * dt * math.cos(rad)
 		self.x += dx
 		self.y += dy
 		# Keep the ship within the window boundaries
@@ -50,65 +111,108 @@ class Ship:
 	def rotate(self, delta):
 		self.angle = (self.angle + delta) % 360
 
-	# Draw the ship and the small red triangle at the tip
-	def draw(self, surface):
+	# Draw the ship and the small red triangle at the tip, alpha (0 to 1) of the way from the
+	# state at the start of the last step to the current one
+	def draw(self, surface, alpha=1.0):
 		# Center of the triangle
-		cx = self.x + self.width // 2
-		cy = self.y + self.height // 2
-		# Triangle points before rotation
-		top = (self.x + self.width // 2, self.y)
-		left = (self.x, self.y + self.height)
-		right = (self.x + self.width, self.y + self.height)
-		points = [left, right, top]
-		# Function to rotate a point around the center
-		def rotate_point(px, py):
-			rad = math.radians(self.angle)
-			dx = px - cx
-			dy = py - cy
-			qx = cx + dx * math.cos(rad) - dy * math.sin(rad)
-			qy = cy + dx * math.sin(rad) + dy * math.cos(rad)
-			return (int(qx), int(qy))
-		# Apply rotation to all points
-		rotated_points = [rotate_point(px, py) for (px, py) in points]
-		# Draw the main blue triangle
-		pygame.draw.polygon(surface, BLUE, rotated_points)
-		# Draw the small red triangle at the tip
-		tip = rotated_points[2]
-		base_left = rotated_points[0]
-		base_right = rotated_points[1]
-		vx = base_right[0] - base_left[0]
-		vy = base_right[1] - base_left[1]
-		base_len = math.hypot(vx, vy)
-		mini_height = 18
-		mini_base = 16
-		if base_len == 0:
-			mini_left = mini_right = tip
-		else:
-			# Perpendicular unit vector to the base (points "backwards" from the tip)
-			perp_vx = -(vy / base_len)
-			perp_vy = vx / base_len
-			# Center of the small triangle's base
-			mini_base_cx = tip[0] + perp_vx * mini_height
-			mini_base_cy = tip[1] + perp_vy * mini_height
-			# Unit vector along the base
-			unit_vx = vx / base_len
-			unit_vy = vy / base_len
-			# Left and right points of the small triangle's base
-			mini_left = (
-				int(mini_base_cx - unit_vx * (mini_base / 2)),
-				int(mini_base_cy - unit_vy * (mini_base / 2))
-			)
-			mini_right = (
-				int(mini_base_cx + unit_vx * (mini_base / 2)),
-				int(mini_base_cy + unit_vy * (mini_base / 2))
-			)
-		mini_points = [mini_left, mini_right, tip]
-		pygame.draw.polygon(surface, (255, 0, 0), mini_points)
-
-# Main game loop
-def main():
+		cx = self.prev_x + (self.x - self.prev_x) * alpha + self.width // 2
+		cy = self.prev_y + (self.y - self.prev_y) * alpha + self.height // 2
+		# Both polygons are already rotated, they only have to be moved to the center
+		angle = self.prev_angle + ((self.angle - self.prev_angle + 180) % 360 - 180) * alpha
+		index = SHIP_GEOMETRY.index(angle)
+		pygame.draw.polygon(surface, BLUE, [(int(cx + px), int(cy + py)) for px, py in SHIP_GEOMETRY.body[index]])
+		pygame.draw.polygon(surface, RED, [(int(cx + px), int(cy + py)) for px, py in SHIP_GEOMETRY.tip[index]])
+
+# Swarm of ships for stress tests, stored as NumPy arrays with one entry per ship: moving,
+# clamping, rotating and building the polygons of every ship are single array operations,
+# only the pygame draw calls are made ship by ship
+class Swarm:
+	def __init__(self, count, seed=None):
+		rng = np.random.default_rng(seed)
+		self.width = TRI_WIDTH
+		self.height = TRI_HEIGHT
+		self.x = rng.uniform(0, SCREEN_WIDTH - self.width, count)
+		self.y = rng.uniform(0, SCREEN_HEIGHT - self.height, count)
+		self.angle = rng.uniform(0, 360, count)
+		self.speed = rng.uniform(TRI_SPEED / 4, TRI_SPEED, count)
+		self.turn_rate = rng.uniform(-SWARM_TURN_RATE, SWARM_TURN_RATE, count)
+		self.save_state()
+
+	def __len__(self):
+		return len(self.x)
+
+	# Remember where the ships are at the start of a simulation step, drawing interpolates from there
+	def save_state(self):
+		self.prev_x = self.x.copy()
+		self.prev_y = self.y.copy()
+		self.prev_angle = self.angle.copy()
+
+	# Move every ship forward in the direction it is pointing for dt seconds
+	def move_forward(self, dt):
+		rad = np.radians(self.angle)
+		distance = self.speed * dt
+		self.x += distance * np.sin(rad)
+		self.y -= distance * np.cos(rad)
+		# Keep the ships within the window boundaries
+		np.clip(self.x, 0, SCREEN_WIDTH - self.width, out=self.x)
+		np.clip(self.y, 0, SCREEN_HEIGHT - self.height, out=self.y)
+
+	# Rotate every ship by delta degrees (a number, or an array with one angle per ship)
+	def rotate(self, delta):
+		self.angle = (self.angle + delta) % 360
+
+	# Turn every ship by its own turn rate for dt seconds, so the swarm wanders around the window
+	def wander(self, dt):
+		self.rotate(self.turn_rate * dt)
+
+	# Polygons of every ship, as integer arrays of shape (ships, 3, 2): the rotated tables of each
+	# ship's angle moved to its center, alpha (0 to 1) of the way from the last step to the current one
+	def polygons(self, alpha=1.0):
+		angle = self.prev_angle + ((self.angle - self.prev_angle + 180) % 360 - 180) * alpha
+		x = self.prev_x + (self.x - self.prev_x) * alpha
+		y = self.prev_y + (self.y - self.prev_y) * alpha
+		index = np.rint(angle * SHIP_GEOMETRY.steps / 360).astype(int) % SHIP_GEOMETRY.steps
+		centers = np.stack((x + self.width // 2, y + self.height // 2), axis=1)[:, None, :]
+		body = (centers + SHIP_GEOMETRY.body_array[index]).astype(int)
+		tip = (centers + SHIP_GEOMETRY.tip_array[index]).astype(int)
+		return body, tip
+
+	# Draw polygons made by polygons (two draw calls per ship)
+	def draw_polygons(self, surface, body, tip):
+		draw_polygon = pygame.draw.polygon
+		for body_points, tip_points in zip(body.tolist(), tip.tolist()):
+			draw_polygon(surface, BLUE, body_points)
+			draw_polygon(surface, RED, tip_points)
+
+	def draw(self, surface, alpha=1.0):
+		self.draw_polygons(surface, *self.polygons(alpha))
+
+# Advance the simulation by one fixed step of dt seconds, turning the player ship at turn
+# degrees per second
+def update(ship, swarm, turn, dt):
+	ship.save_state()
+	ship.rotate(turn * dt)
+	if BRAKE == 0:
+		ship.move_forward(dt)
+	elif BRAKE == 1:
+		pass  # Only moves if toggled to 0
+	if swarm is not None:
+		swarm.save_state()
+		swarm.wander(dt)
+		if BRAKE == 0:
+			swarm.move_forward(dt)
+
+# Main game loop: the simulation runs at a fixed step whatever the render rate (frames per second),
+# swarm_size > 0 adds a swarm and shows where the frame time goes in the title
+def main(swarm_size=0, seed=None, render_rate=FPS):
 	running = True
 	ship = Ship()
+	swarm = Swarm(swarm_size, seed) if swarm_size > 0 else None
+	accumulator = 0.0
+	last_time = time.perf_counter()
+	frame_count = 0
+	update_time = transform_time = draw_time = 0.0
+	report_time = time.perf_counter()
 	global BRAKE
 	w_pressed_last = False
 	while running:
@@ -123,19 +227,47 @@ def main():
 			w_pressed_last = True
 		else:
 			w_pressed_last = False
-		if keys[pygame.K_a]:
-			ship.rotate(-5)
-		if keys[pygame.K_d]:
-			ship.rotate(5)
-		if BRAKE == 0:
-			ship.move_forward()
-		elif BRAKE == 1:
-			pass  # Only moves if toggled to 0
+		turn = (keys[pygame.K_d] - keys[pygame.K_a]) * TURN_SPEED
+		# Run as many fixed steps as the real time elapsed since the last frame
+		frame_start = time.perf_counter()
+		accumulator = min(accumulator + frame_start - last_time, MAX_FRAME_TIME)
+		last_time = frame_start
+		while accumulator >= STEP_TIME:
+			accumulator -= STEP_TIME
+			update(ship, swarm, turn, STEP_TIME)
+		alpha = accumulator / STEP_TIME
+		transform_start = time.perf_counter()
 		screen.fill(BLACK)
-		ship.draw(screen)
+		if swarm is not None:
+			polygons = swarm.polygons(alpha)
+			draw_start = time.perf_counter()
+			swarm.draw_polygons(screen, *polygons)
+		else:
+			draw_start = time.perf_counter()
+		ship.draw(screen, alpha)
 		pygame.display.flip()
-		clock.tick(FPS)
+		if swarm is not None:
+			# Average update, batched transform and draw call time per frame
+			frame_end = time.perf_counter()
+			frame_count += 1
+			update_time += transform_start - frame_start
+			transform_time += draw_start - transform_start
+			draw_time += frame_end - draw_start
+			if frame_end - report_time >= SWARM_REPORT_INTERVAL:
+				pygame.display.set_caption(
+					f"Triangle Movement - {len(swarm)} ships, update {update_time / frame_count * 1000:.2f} ms, "
+					f"transform {transform_time / frame_count * 1000:.2f} ms, draw {draw_time / frame_count * 1000:.2f} ms, "
+					f"{frame_count / (frame_end - report_time):.0f} fps")
+				frame_count = 0
+				update_time = transform_time = draw_time = 0.0
+				report_time = frame_end
+		clock.tick(render_rate)
 	pygame.quit()
 
 if __name__ == "__main__":
-	main()
\ No newline at end of file
+	parser = argparse.ArgumentParser(description="Triangle Movement")
+	parser.add_argument("--swarm", type=int, default=0, help="ships in the swarm (0: only the player ship)")
+	parser.add_argument("--seed", type=int, default=None, help="seed for the swarm start positions, angles and speeds")
+	parser.add_argument("--fps", type=int, default=FPS, help="render rate, the simulation always runs at a fixed step")
+	args = parser.parse_args()
+	main(args.swarm, args.seed, args.fps)
\ No newline at end of file
@@ -24,7 +24,8 @@ from constants import (
     GP_BUTTON_MEDKIT_SET,
     GP_BUTTON_SHOP_SET,
 )
-from utils import load_image, load_sound, draw_multiline_center, draw_health_bar
+from utils import load_image, load_sound, draw_multiline_center, draw_health_bar, get_sys_font
+from text_cache import render_text
 from entities import Player, Enemy, Item, Grenade, Explosion
 
 
@@ -412,17 +413,17 @@ class Game:
     def draw_start_screen(self):
         self.screen.fill((5, 5, 8))
 
-        title_font = pygame.font.SysFont("consolas", 42, bold=True)
-        text_font = pygame.font.SysFont("consolas", 22)
-        small_font = pygame.font.SysFont("consolas", 18)
+        title_font = get_sys_font("consolas", 42, bold=True)
+        text_font = get_sys_font("consolas", 22)
+        small_font = get_sys_font("consolas", 18)
 
         title = "Vila Morta: Último Quarteirão"
-        t_surf = title_font.render(title, True, (0, 220, 120))
+        t_surf = render_text(title_font, title, True, (0, 220, 120))
         t_rect = t_surf.get_rect(center=(WIDTH // 2, 80))
         self.screen.blit(t_surf, t_rect)
 
         obj = "Objetivo: sobreviva 5 minutos OU mate 100 zumbis."
-        o_surf = text_font.render(obj, True, (230, 230, 230))
+        o_surf = render_text(text_font, obj, True, (230, 230, 230))
         o_rect = o_surf.get_rect(center=(WIDTH // 2, 140))
         self.screen.blit(o_surf, o_rect)
 
@@ -438,27 +439,27 @@ class Game:
         )
 
         hint1 = "WASD: mover   |   ESPAÇO: atirar   |   G: granada"
-        h1_surf = small_font.render(hint1, True, (180, 180, 180))
+        h1_surf = render_text(small_font, hint1, True, (180, 180, 180))
         h1_rect = h1_surf.get_rect(center=(WIDTH // 2, HEIGHT - 100))
         self.screen.blit(h1_surf, h1_rect)
 
         hint2 = "Pressione ESPAÇO ou ENTER para começar"
-        h2_surf = small_font.render(hint2, True, (0, 220, 120))
+        h2_surf = render_text(small_font, hint2, True, (0, 220, 120))
         h2_rect = h2_surf.get_rect(center=(WIDTH // 2, HEIGHT - 60))
         self.screen.blit(h2_surf, h2_rect)
 
     def draw_end_screen(self):
         self.screen.fill((0, 0, 0))
 
-        big_font = pygame.font.SysFont("consolas", 40, bold=True)
-        text_font = pygame.font.SysFont("consolas", 22)
-        small_font = pygame.font.SysFont("consolas", 18)
+        big_font = get_sys_font("consolas", 40, bold=True)
+        text_font = get_sys_font("consolas", 22)
+        small_font = get_sys_font("consolas", 18)
 
         victory = (self.state == "victory")
         title = "VITÓRIA" if victory else "GAME OVER"
         color = (0, 230, 120) if victory else (220, 40, 40)
 
-        t_surf = big_font.render(title, True, color)
+        t_surf = render_text(big_font, title, True, color)
         t_rect = t_surf.get_rect(center=(WIDTH // 2, 80))
         self.screen.blit(t_surf, t_rect)
 
@@ -469,7 +470,7 @@ class Game:
             elapsed_sec = 0
 
         stats_line = f"Tempo sobrevivido: {elapsed_sec}s   |   Zumbis mortos: {self.zombies_killed}"
-        s_surf = text_font.render(stats_line, True, (230, 230, 230))
+        s_surf = render_text(text_font, stats_line, True, (230, 230, 230))
         s_rect = s_surf.get_rect(center=(WIDTH // 2, 140))
         self.screen.blit(s_surf, s_rect)
 
@@ -486,12 +487,12 @@ class Game:
         )
 
         hint = "Pressione ESPAÇO ou ENTER para jogar novamente  |  ESC para sair"
-        h_surf = small_font.render(hint, True, (180, 180, 180))
+        h_surf = render_text(small_font, hint, True, (180, 180, 180))
         h_rect = h_surf.get_rect(center=(WIDTH // 2, HEIGHT - 60))
         self.screen.blit(h_surf, h_rect)
 
     def debug(self):
-        f = pygame.font.SysFont("consolas", 18)
+        f = get_sys_font("consolas", 18)
 
         now = pygame.time.get_ticks()
         if self.start_time is None:
@@ -501,11 +502,11 @@ class Game:
         remaining_sec = max(0, 5 * 60 - elapsed_sec)
 
         t_obj = "Objetivo: sobreviva 5 min ou mate 100 zumbis"
-        s_obj = f.render(t_obj, True, (255, 255, 255))
+        s_obj = render_text(f, t_obj, True, (255, 255, 255))
         self.screen.blit(s_obj, (10, 10))
 
         t_prog = f"Tempo: {elapsed_sec:3d}s  Restante: {remaining_sec:3d}s  Kills: {self.zombies_killed}/100"
-        s_prog = f.render(t_prog, True, (255, 255, 255))
+        s_prog = render_text(f, t_prog, True, (255, 255, 255))
         self.screen.blit(s_prog, (10, 30))
 
         t_status = (
@@ -515,7 +516,7 @@ class Game:
             f"Z {len(self.enemies)}  "
             f"I {len(self.items)}"
         )
-        s_status = f.render(t_status, True, (255, 255, 255))
+        s_status = render_text(f, t_status, True, (255, 255, 255))
         self.screen.blit(s_status, (10, 50))
 
 
@@ -1,6 +1,9 @@
 # utils.py
+from functools import lru_cache
+
 import pygame
 from constants import ASSETS_DIR
+from text_cache import render_text
 
 
 def load_image(filename, size=None, fallback_color=(255, 255, 255)):
@@ -24,6 +27,11 @@ def load_sound(filename, volume=1.0):
     return None
 
 
+@lru_cache(maxsize=None)
+def get_sys_font(name, size, bold=False):
+    return pygame.font.SysFont(name, size, bold=bold)
+
+
 def draw_health_bar(surface, center_pos, width, height, hp, max_hp):
     ratio = max(0.0, min(1.0, hp / max_hp))
     x = center_pos[0] - width // 2
@@ -64,7 +72,7 @@ def draw_multiline_center(surface, text, font, color, center_x, start_y, max_wid
 
     y = start_y
     for line in lines:
-        surf = font.render(line, True, color)
+        surf = render_text(font, line, True, color)
         rect = surf.get_rect(center=(center_x, y))
         surface.blit(surf, rect)
         y += line_height